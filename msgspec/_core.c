@@ -15,6 +15,13 @@
 #include "ryu.h"
 #include "atof.h"
 
+/* SSE2 is part of the x86-64 baseline, so it's always available there. Other
+ * platforms use portable scalar code instead. */
+#if defined(__SSE2__) || defined(_M_X64)
+#define MS_HAVE_SSE2 1
+#include <emmintrin.h>
+#endif
+
 /* Python version checks */
 #define PY310_PLUS (PY_VERSION_HEX >= 0x030a0000)
 #define PY311_PLUS (PY_VERSION_HEX >= 0x030b0000)
@@ -43,6 +50,39 @@ ms_popcount(uint64_t i) {                            \
 }
 #endif
 
+/* Count trailing zeros. The input must be non-zero. */
+#if defined(__GNUC__)
+#define ms_ctz(i) __builtin_ctz(i)
+#elif defined(_MSC_VER)
+#include <intrin.h>
+static MS_INLINE int
+ms_ctz(uint32_t i) {
+    unsigned long out;
+    _BitScanForward(&out, i);
+    return (int)out;
+}
+#else
+static int
+ms_ctz(uint32_t i) {
+    int out = 0;
+    while (!(i & 1)) {
+        i >>= 1;
+        out++;
+    }
+    return out;
+}
+#endif
+
+#if defined(__GNUC__)
+#define ms_ctz64(i) __builtin_ctzll(i)
+#else
+static MS_INLINE int
+ms_ctz64(uint64_t i) {
+    uint32_t low = (uint32_t)i;
+    return low ? ms_ctz(low) : 32 + ms_ctz((uint32_t)(i >> 32));
+}
+#endif
+
 /* In Python 3.12+, tp_dict is NULL for some core types, PyType_GetDict returns
  * a borrowed reference to the interpreter or cls mapping */
 #if PY312_PLUS
@@ -121,6 +161,35 @@ ascii_get_buffer(PyObject *str) {
     return (char *)(((PyASCIIObject *)str) + 1);
 }
 
+/* Check if two buffers of `size` bytes are equal. Used when comparing short
+ * strings like field names, where a call to `memcmp` costs more than the
+ * comparison itself. Sizes up to 16 are handled with two (possibly
+ * overlapping) fixed-size loads from each buffer, all in bounds. */
+static MS_INLINE bool
+ms_memeq(const char *a, const char *b, Py_ssize_t size) {
+    if (size >= 8) {
+        if (size > 16) return memcmp(a, b, size) == 0;
+        uint64_t a0, a1, b0, b1;
+        memcpy(&a0, a, 8);
+        memcpy(&b0, b, 8);
+        memcpy(&a1, a + size - 8, 8);
+        memcpy(&b1, b + size - 8, 8);
+        return ((a0 ^ b0) | (a1 ^ b1)) == 0;
+    }
+    if (size >= 4) {
+        uint32_t a0, a1, b0, b1;
+        memcpy(&a0, a, 4);
+        memcpy(&b0, b, 4);
+        memcpy(&a1, a + size - 4, 4);
+        memcpy(&b1, b + size - 4, 4);
+        return ((a0 ^ b0) | (a1 ^ b1)) == 0;
+    }
+    for (Py_ssize_t i = 0; i < size; i++) {
+        if (a[i] != b[i]) return false;
+    }
+    return true;
+}
+
 /* Fill in view.buf & view.len from either a Unicode or buffer-compatible
  * object. */
 static int
@@ -236,6 +305,26 @@ fast_long_extract_parts(PyObject *vv, bool *neg, uint64_t *scale) {
 
 static const char hex_encode_table[] = "0123456789abcdef";
 
+/* The value of each hex digit, or -1 for non-hex characters */
+static const int8_t hex_decode_table[256] = {
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+     0,  1,  2,  3,  4,  5,  6,  7,  8,  9, -1, -1, -1, -1, -1, -1,
+    -1, 10, 11, 12, 13, 14, 15, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, 10, 11, 12, 13, 14, 15, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+    -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,
+};
+
 static const char base64_encode_table[] =
 "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/";
 
@@ -399,6 +488,7 @@ typedef struct {
     PyObject *str___msgspec_cached_hash__;
     PyObject *str__value2member_map_;
     PyObject *str___msgspec_cache__;
+    PyObject *str___msgspec_typenode__;
     PyObject *str__value_;
     PyObject *str__missing_;
     PyObject *str_type;
@@ -619,7 +709,7 @@ pathnode_reverse(PathNode *path) {
 
 static PyObject* StructMeta_get_field_name(PyObject*, Py_ssize_t);
 
-static PyObject *
+static MS_COLD PyObject *
 PathNode_ErrSuffix(PathNode *path) {
     strbuilder parts = {0};
     PathNode *path_orig;
@@ -1138,7 +1228,7 @@ _StrLookup_lookup(StrLookup *self, const char *key, Py_ssize_t size)
         if (entry->value == NULL) return entry;
         Py_ssize_t entry_size;
         const char *entry_key = unicode_str_and_size_nocheck(entry->key, &entry_size);
-        if (entry_size == size && memcmp(entry_key, key, size) == 0) return entry;
+        if (entry_size == size && ms_memeq(entry_key, key, size)) return entry;
         /* Collision, perturb and try again */
         perturb >>= 5;
         i = mask & (i*5 + perturb + 1);
@@ -1161,19 +1251,72 @@ StrLookup_Set(StrLookup *self, PyObject *key, PyObject *value) {
     return 0;
 }
 
+/* The largest number of keys for which a collision-free table is searched */
+#define STR_LOOKUP_PERFECT_MAX_ITEMS 32
+
+/* Choose the table size for a StrLookup over `keys` (a list or tuple). The
+ * minimum size keeps the load factor under 75%. Small lookups (e.g. the tags
+ * of a tagged union, or the values of a Literal) also try the next two sizes
+ * up, looking for one where every key has a distinct home slot. Lookups of
+ * valid keys in such a table always resolve with a single probe. */
+static int
+StrLookup_choose_size(PyObject *keys, size_t *out) {
+    Py_ssize_t nitems = PySequence_Fast_GET_SIZE(keys);
+    size_t needed = nitems * 4 / 3;
+    size_t size = 4;
+    while (size < (size_t)needed) {
+        size <<= 1;
+    }
+    *out = size;
+
+    if (nitems > STR_LOOKUP_PERFECT_MAX_ITEMS) return 0;
+
+    uint32_t hashes[STR_LOOKUP_PERFECT_MAX_ITEMS];
+    PyObject **items = PySequence_Fast_ITEMS(keys);
+    for (Py_ssize_t i = 0; i < nitems; i++) {
+        /* Invalid keys error later, when the table is filled */
+        if (!PyUnicode_CheckExact(items[i])) return 0;
+        Py_ssize_t key_size;
+        const char *key_str = unicode_str_and_size(items[i], &key_size);
+        if (key_str == NULL) return -1;
+        hashes[i] = murmur2(key_str, key_size);
+    }
+
+    for (size_t candidate = size; candidate <= size * 4; candidate <<= 1) {
+        bool collision = false;
+        for (Py_ssize_t i = 1; i < nitems && !collision; i++) {
+            for (Py_ssize_t j = 0; j < i; j++) {
+                if (((hashes[i] ^ hashes[j]) & (candidate - 1)) == 0) {
+                    collision = true;
+                    break;
+                }
+            }
+        }
+        if (!collision) {
+            *out = candidate;
+            break;
+        }
+    }
+    return 0;
+}
+
 static PyObject *
 StrLookup_New(PyObject *arg, PyObject *tag_field, PyObject *cls, bool array_like) {
     Py_ssize_t nitems;
-    PyObject *item, *items = NULL;
+    PyObject *item, *items = NULL, *keys = NULL;
     StrLookup *self = NULL;
 
     if (PyDict_CheckExact(arg)) {
         nitems = PyDict_GET_SIZE(arg);
+        keys = PyDict_Keys(arg);
+        if (keys == NULL) return NULL;
     }
     else {
         items = PySequence_Tuple(arg);
         if (items == NULL) return NULL;
         nitems = PyTuple_GET_SIZE(items);
+        keys = items;
+        Py_INCREF(keys);
     }
 
     /* Must have at least one item */
@@ -1186,11 +1329,8 @@ StrLookup_New(PyObject *arg, PyObject *tag_field, PyObject *cls, bool array_like
         goto cleanup;
     }
 
-    size_t needed = nitems * 4 / 3;
-    size_t size = 4;
-    while (size < (size_t)needed) {
-        size <<= 1;
-    }
+    size_t size;
+    if (StrLookup_choose_size(keys, &size) < 0) goto cleanup;
     self = PyObject_GC_NewVar(StrLookup, &StrLookup_Type, size);
     if (self == NULL) goto cleanup;
     /* Zero out memory */
@@ -1240,6 +1380,7 @@ StrLookup_New(PyObject *arg, PyObject *tag_field, PyObject *cls, bool array_like
 
 cleanup:
     Py_XDECREF(items);
+    Py_XDECREF(keys);
     if (self != NULL) {
         PyObject_GC_Track(self);
     }
@@ -2891,6 +3032,7 @@ typedef struct {
     PyObject *struct_defaults;
     Py_ssize_t *struct_offsets;
     PyObject *struct_encode_fields;
+    uint8_t *struct_key_index;  /* see structmeta_construct_key_index */
     struct StructInfo *struct_info;
     Py_ssize_t nkwonly;
     Py_ssize_t n_trailing_defaults;
@@ -5029,6 +5171,106 @@ done:
     return out;
 }
 
+/*************************************************************************
+ * TypeNode Cache                                                        *
+ *************************************************************************/
+
+/* The module-level `decode` & `convert` functions convert their `type`
+ * argument to a TypeNode on every call. For typing aliases like `List[int]`
+ * or `Union[A, B]` this means walking the type in Python, which can cost more
+ * than decoding a small message. Like the info objects cached on Struct,
+ * dataclass & TypedDict types, the converted TypeNode is cached on the alias
+ * itself (as `__msgspec_typenode__`), wrapped in a GC-tracked TypeNodeInfo.
+ * The cache entry lives exactly as long as the alias, and never keeps an
+ * object alive that the alias doesn't already reference.
+ *
+ * Classes aren't cached here, their info is already cached on the class.
+ * Aliases that don't support attributes (e.g. `list[int]`) are converted on
+ * every call. */
+
+typedef struct {
+    PyObject_HEAD
+    TypeNode *type;
+} TypeNodeInfo;
+
+static PyTypeObject TypeNodeInfo_Type;
+
+/* Returns a new reference to a TypeNodeInfo for `type`, from the cache if
+ * possible */
+static PyObject *
+TypeNodeInfo_Convert(PyObject *type) {
+    MsgspecState *mod = msgspec_get_global_state();
+    bool cacheable = !PyType_Check(type);
+
+    if (cacheable) {
+        PyObject *cached = PyObject_GenericGetAttr(type, mod->str___msgspec_typenode__);
+        if (cached != NULL) {
+            if (MS_LIKELY(Py_TYPE(cached) == &TypeNodeInfo_Type)) return cached;
+            /* Overwritten, convert and replace it below */
+            Py_DECREF(cached);
+        }
+        else {
+            PyErr_Clear();
+        }
+    }
+
+    TypeNode *node = TypeNode_Convert(type);
+    if (node == NULL) return NULL;
+
+    TypeNodeInfo *info = PyObject_GC_New(TypeNodeInfo, &TypeNodeInfo_Type);
+    if (info == NULL) {
+        TypeNode_Free(node);
+        return NULL;
+    }
+    info->type = node;
+    PyObject_GC_Track(info);
+
+    if (cacheable) {
+        if (PyObject_GenericSetAttr(type, mod->str___msgspec_typenode__, (PyObject *)info) < 0) {
+            /* Object doesn't support attributes, skip caching */
+            PyErr_Clear();
+        }
+    }
+    return (PyObject *)info;
+}
+
+static int
+TypeNodeInfo_traverse(TypeNodeInfo *self, visitproc visit, void *arg)
+{
+    if (self->type == NULL) return 0;
+    return TypeNode_traverse(self->type, visit, arg);
+}
+
+static int
+TypeNodeInfo_clear(TypeNodeInfo *self)
+{
+    TypeNode *type = self->type;
+    if (type != NULL) {
+        self->type = NULL;
+        TypeNode_Free(type);
+    }
+    return 0;
+}
+
+static void
+TypeNodeInfo_dealloc(TypeNodeInfo *self)
+{
+    PyObject_GC_UnTrack(self);
+    TypeNodeInfo_clear(self);
+    Py_TYPE(self)->tp_free((PyObject *)self);
+}
+
+static PyTypeObject TypeNodeInfo_Type = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    .tp_name = "msgspec._core.TypeNodeInfo",
+    .tp_basicsize = sizeof(TypeNodeInfo),
+    .tp_itemsize = 0,
+    .tp_flags = Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC,
+    .tp_clear = (inquiry)TypeNodeInfo_clear,
+    .tp_traverse = (traverseproc)TypeNodeInfo_traverse,
+    .tp_dealloc = (destructor)TypeNodeInfo_dealloc,
+};
+
 #define ms_raise_validation_error(path, format, ...) \
     do { \
         MsgspecState *st = msgspec_get_global_state(); \
@@ -5039,7 +5281,7 @@ done:
         } \
     } while (0)
 
-static MS_NOINLINE PyObject *
+static MS_COLD PyObject *
 ms_validation_error(const char *got, TypeNode *type, PathNode *path) {
     PyObject *type_repr = typenode_simple_repr(type);
     if (type_repr != NULL) {
@@ -5049,7 +5291,7 @@ ms_validation_error(const char *got, TypeNode *type, PathNode *path) {
     return NULL;
 }
 
-static void
+static MS_COLD void
 ms_missing_required_field(PyObject *field, PathNode *path) {
     ms_raise_validation_error(
         path,
@@ -5058,7 +5300,7 @@ ms_missing_required_field(PyObject *field, PathNode *path) {
     );
 }
 
-static PyObject *
+static MS_COLD PyObject *
 ms_invalid_cstr_value(const char *cstr, Py_ssize_t size, PathNode *path) {
     PyObject *str = PyUnicode_DecodeUTF8(cstr, size, NULL);
     if (str == NULL) return NULL;
@@ -5067,19 +5309,19 @@ ms_invalid_cstr_value(const char *cstr, Py_ssize_t size, PathNode *path) {
     return NULL;
 }
 
-static PyObject *
+static MS_COLD PyObject *
 ms_invalid_cint_value(int64_t val, PathNode *path) {
     ms_raise_validation_error(path, "Invalid value %lld%U", val);
     return NULL;
 }
 
-static PyObject *
+static MS_COLD PyObject *
 ms_invalid_cuint_value(uint64_t val, PathNode *path) {
     ms_raise_validation_error(path, "Invalid value %llu%U", val);
     return NULL;
 }
 
-static MS_NOINLINE PyObject *
+static MS_COLD PyObject *
 ms_error_unknown_field(const char *key, Py_ssize_t key_size, PathNode *path) {
     PyObject *field = PyUnicode_FromStringAndSize(key, key_size);
     if (field == NULL) return NULL;
@@ -5090,8 +5332,19 @@ ms_error_unknown_field(const char *key, Py_ssize_t key_size, PathNode *path) {
     return NULL;
 }
 
+static MS_COLD PyObject *
+ms_error_array_too_short(Py_ssize_t min_size, Py_ssize_t size, PathNode *path) {
+    ms_raise_validation_error(
+        path,
+        "Expected `array` of at least length %zd, got %zd%U",
+        min_size,
+        size
+    );
+    return NULL;
+}
+
 /* Same as ms_raise_validation_error, except doesn't require any format arguments. */
-static PyObject *
+static MS_COLD PyObject *
 ms_error_with_path(const char *msg, PathNode *path) {
     MsgspecState *st = msgspec_get_global_state();
     PyObject *suffix = PathNode_ErrSuffix(path);
@@ -5102,7 +5355,7 @@ ms_error_with_path(const char *msg, PathNode *path) {
     return NULL;
 }
 
-static MS_NOINLINE void
+static MS_COLD void
 ms_maybe_wrap_validation_error(PathNode *path) {
     PyObject *exc_type, *exc, *tb;
 
@@ -5233,40 +5486,92 @@ StructMeta_get_field_name(PyObject *self, Py_ssize_t field_index) {
     );
 }
 
+/* The number of lanes in each block of a struct's key index */
+#define STRUCT_KEY_INDEX_BLOCK 16
+
+static MS_INLINE bool
+StructMeta_field_matches(
+    StructMetaObject *self, Py_ssize_t i, const char * key, Py_ssize_t key_size
+) {
+    Py_ssize_t field_size;
+    const char *field = unicode_str_and_size_nocheck(
+        PyTuple_GET_ITEM(self->struct_encode_fields, i), &field_size
+    );
+    return key_size == field_size && ms_memeq(key, field, key_size);
+}
+
 static MS_INLINE Py_ssize_t
 StructMeta_get_field_index(
     StructMetaObject *self, const char * key, Py_ssize_t key_size, Py_ssize_t *pos
 ) {
-    const char *field;
-    Py_ssize_t nfields, field_size, i, offset = *pos;
+    Py_ssize_t nfields, i, offset = *pos;
     nfields = PyTuple_GET_SIZE(self->struct_encode_fields);
-    for (i = offset; i < nfields; i++) {
-        field = unicode_str_and_size_nocheck(
-            PyTuple_GET_ITEM(self->struct_encode_fields, i), &field_size
-        );
-        if (key_size == field_size && memcmp(key, field, key_size) == 0) {
-            *pos = i < (nfields - 1) ? (i + 1) : 0;
-            return i;
-        }
-    }
-    for (i = 0; i < offset; i++) {
-        field = unicode_str_and_size_nocheck(
-            PyTuple_GET_ITEM(self->struct_encode_fields, i), &field_size
-        );
-        if (key_size == field_size && memcmp(key, field, key_size) == 0) {
-            *pos = i + 1;
-            return i;
+
+    /* Fields are usually sent in order, check the expected field first */
+    if (MS_LIKELY(offset < nfields)) {
+        if (StructMeta_field_matches(self, offset, key, key_size)) {
+            *pos = offset < (nfields - 1) ? (offset + 1) : 0;
+            return offset;
         }
     }
-    /* Not a field, check if it matches the tag field (if present) */
-    if (MS_UNLIKELY(self->struct_tag_field != NULL)) {
+
+    /* Next check if it matches the tag field (if present). Encoded tagged
+     * structs lead with the tag, and a tag field can't share a name with a
+     * field, so this is checked before searching the other fields. */
+    if (self->struct_tag_field != NULL) {
         Py_ssize_t tag_field_size;
         const char *tag_field;
         tag_field = unicode_str_and_size_nocheck(self->struct_tag_field, &tag_field_size);
-        if (key_size == tag_field_size && memcmp(key, tag_field, key_size) == 0) {
+        if (key_size == tag_field_size && ms_memeq(key, tag_field, key_size)) {
             return -2;
         }
     }
+
+    /* Otherwise use the key index to find candidate fields with the same
+     * size and first byte, checking only those in full */
+    Py_ssize_t nlanes = (
+        (nfields + STRUCT_KEY_INDEX_BLOCK - 1) & ~(STRUCT_KEY_INDEX_BLOCK - 1)
+    );
+    const uint8_t *sizes = self->struct_key_index;
+    const uint8_t *firsts = sizes + nlanes;
+    uint8_t size = key_size < 255 ? (uint8_t)key_size : 255;
+    uint8_t first = key_size > 0 ? (uint8_t)key[0] : 0;
+    for (Py_ssize_t base = 0; base < nfields; base += STRUCT_KEY_INDEX_BLOCK) {
+#if MS_HAVE_SSE2
+        uint32_t mask = _mm_movemask_epi8(
+            _mm_and_si128(
+                _mm_cmpeq_epi8(
+                    _mm_loadu_si128((const __m128i *)(sizes + base)),
+                    _mm_set1_epi8((char)size)
+                ),
+                _mm_cmpeq_epi8(
+                    _mm_loadu_si128((const __m128i *)(firsts + base)),
+                    _mm_set1_epi8((char)first)
+                )
+            )
+        );
+#else
+        uint32_t mask = 0;
+        for (int j = 0; j < STRUCT_KEY_INDEX_BLOCK; j++) {
+            mask |= (
+                (uint32_t)(sizes[base + j] == size && firsts[base + j] == first)
+            ) << j;
+        }
+#endif
+        /* Ignore any padding lanes in the last block */
+        if (nfields - base < STRUCT_KEY_INDEX_BLOCK) {
+            mask &= (1u << (nfields - base)) - 1;
+        }
+        while (mask != 0) {
+            i = base + ms_ctz(mask);
+            if (StructMeta_field_matches(self, i, key, key_size)) {
+                *pos = i < (nfields - 1) ? (i + 1) : 0;
+                return i;
+            }
+            mask &= mask - 1;
+        }
+    }
+
     return -1;
 }
 
@@ -5448,6 +5753,7 @@ typedef struct {
     PyObject *tag_field;
     PyObject *tag_value;
     Py_ssize_t *offsets;
+    uint8_t *key_index;
     Py_ssize_t nkwonly;
     Py_ssize_t n_trailing_defaults;
     /* Configuration values. All borrowed references. */
@@ -6189,6 +6495,36 @@ structmeta_construct_offsets(
     return 0;
 }
 
+/* Build an index of the encoded field names, used to quickly find candidate
+ * fields when decoding an object key that isn't the next expected field.
+ *
+ * The index is split into two arrays of `nfields` lanes, rounded up to a
+ * multiple of STRUCT_KEY_INDEX_BLOCK so whole blocks can be compared at once.
+ * The first holds the size of each name in bytes (saturated at 255), and the
+ * second the first byte of each name (or 0 if empty). */
+static int
+structmeta_construct_key_index(StructMetaInfo *info)
+{
+    Py_ssize_t nfields = PyTuple_GET_SIZE(info->encode_fields);
+    Py_ssize_t nlanes = (
+        (nfields + STRUCT_KEY_INDEX_BLOCK - 1) & ~(STRUCT_KEY_INDEX_BLOCK - 1)
+    );
+    info->key_index = PyMem_Calloc(Py_MAX(2 * nlanes, 1), 1);
+    if (info->key_index == NULL) {
+        PyErr_NoMemory();
+        return -1;
+    }
+    for (Py_ssize_t i = 0; i < nfields; i++) {
+        Py_ssize_t size;
+        const char *name = unicode_str_and_size(
+            PyTuple_GET_ITEM(info->encode_fields, i), &size
+        );
+        if (name == NULL) return -1;
+        info->key_index[i] = size < 255 ? (uint8_t)size : 255;
+        info->key_index[nlanes + i] = size > 0 ? (uint8_t)name[0] : 0;
+    }
+    return 0;
+}
 
 static PyObject *
 StructMeta_new_inner(
@@ -6220,6 +6556,7 @@ StructMeta_new_inner(
         .tag_field = NULL,
         .tag_value = NULL,
         .offsets = NULL,
+        .key_index = NULL,
         .nkwonly = 0,
         .n_trailing_defaults = 0,
         .name = name,
@@ -6353,6 +6690,9 @@ StructMeta_new_inner(
     /* Fill in struct offsets */
     if (structmeta_construct_offsets(&info, mod, cls) < 0) goto cleanup;
 
+    /* Build the key index used when decoding */
+    if (structmeta_construct_key_index(&info) < 0) goto cleanup;
+
     /* Cache access to __post_init__ (if defined). */
     cls->post_init = PyObject_GetAttr((PyObject *)cls, mod->str___post_init__);
     if (cls->post_init == NULL) {
@@ -6362,6 +6702,7 @@ StructMeta_new_inner(
     cls->nkwonly = info.nkwonly;
     cls->n_trailing_defaults = info.n_trailing_defaults;
     cls->struct_offsets = info.offsets;
+    cls->struct_key_index = info.key_index;
     Py_INCREF(info.fields);
     cls->struct_fields = info.fields;
     Py_INCREF(info.defaults);
@@ -6410,6 +6751,9 @@ cleanup:
         if (info.offsets != NULL) {
             PyMem_Free(info.offsets);
         }
+        if (info.key_index != NULL) {
+            PyMem_Free(info.key_index);
+        }
         Py_XDECREF(cls);
         return NULL;
     }
@@ -6824,6 +7168,10 @@ StructMeta_clear(StructMetaObject *self)
         PyMem_Free(self->struct_offsets);
         self->struct_offsets = NULL;
     }
+    if (self->struct_key_index != NULL) {
+        PyMem_Free(self->struct_key_index);
+        self->struct_key_index = NULL;
+    }
     return PyType_Type.tp_clear((PyObject *)self);
 }
 
@@ -8311,7 +8659,7 @@ TypedDictInfo_lookup_key(
     nfields = Py_SIZE(self);
     for (i = offset; i < nfields; i++) {
         field = unicode_str_and_size_nocheck(self->fields[i].key, &field_size);
-        if (key_size == field_size && memcmp(key, field, key_size) == 0) {
+        if (key_size == field_size && ms_memeq(key, field, key_size)) {
             *pos = i < (nfields - 1) ? (i + 1) : 0;
             *type = self->fields[i].type;
             return self->fields[i].key;
@@ -8319,7 +8667,7 @@ TypedDictInfo_lookup_key(
     }
     for (i = 0; i < offset; i++) {
         field = unicode_str_and_size_nocheck(self->fields[i].key, &field_size);
-        if (key_size == field_size && memcmp(key, field, key_size) == 0) {
+        if (key_size == field_size && ms_memeq(key, field, key_size)) {
             *pos = i + 1;
             *type = self->fields[i].type;
             return self->fields[i].key;
@@ -8498,7 +8846,7 @@ DataclassInfo_lookup_key(
     nfields = Py_SIZE(self);
     for (i = offset; i < nfields; i++) {
         field = unicode_str_and_size_nocheck(self->fields[i].key, &field_size);
-        if (key_size == field_size && memcmp(key, field, key_size) == 0) {
+        if (key_size == field_size && ms_memeq(key, field, key_size)) {
             *pos = i < (nfields - 1) ? (i + 1) : 0;
             *type = self->fields[i].type;
             return self->fields[i].key;
@@ -8506,7 +8854,7 @@ DataclassInfo_lookup_key(
     }
     for (i = 0; i < offset; i++) {
         field = unicode_str_and_size_nocheck(self->fields[i].key, &field_size);
-        if (key_size == field_size && memcmp(key, field, key_size) == 0) {
+        if (key_size == field_size && ms_memeq(key, field, key_size)) {
             *pos = i + 1;
             *type = self->fields[i].type;
             return self->fields[i].key;
@@ -10233,20 +10581,44 @@ timezone_from_offset(int32_t offset) {
     return tz;
 }
 
-static bool
+static MS_INLINE bool
 is_leap_year(int year)
 {
+    /* Written with bitwise ops to avoid branching. A multiple of 100 is a
+     * multiple of 400 iff it's also a multiple of 16. */
     unsigned int y = (unsigned int)year;
-    return y % 4 == 0 && (y % 100 != 0 || y % 400 == 0);
+    return ((y & 3) == 0) & ((y % 25 != 0) | ((y & 15) == 0));
 }
 
-static int
+/* The number of days past 28 in each month, 2 bits per month. Bits 0-1 are
+ * unused so month `m` is at bits `2m` and `2m + 1`. */
+#define MS_DAYS_PAST_28 0x3bbeecc
+
+static MS_INLINE int
 days_in_month(int year, int month) {
-    static const uint8_t ndays[] = {31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31};
-    if (month == 2 && is_leap_year(year))
-        return 29;
-    else
-        return ndays[month - 1];
+    return (
+        28 + ((MS_DAYS_PAST_28 >> (2 * month)) & 3) +
+        ((month == 2) & is_leap_year(year))
+    );
+}
+
+/* Add `carry` (0 or 1) to a field with values in `[0, limit)`, wrapping it
+ * to 0 on overflow. Returns the carry into the next field. Written without
+ * branches, so a cascade of these compiles to straight-line code. */
+static MS_INLINE int
+ms_carry_field(int *field, int limit, int carry) {
+    int x = *field + carry;
+    carry = (x == limit);
+    *field = x - (limit & -carry);
+    return carry;
+}
+
+static MS_INLINE int
+ms_round_up_time_fields(int *hour, int *minute, int *second, int *microsecond) {
+    int carry = ms_carry_field(microsecond, 1000000, 1);
+    carry = ms_carry_field(second, 60, carry);
+    carry = ms_carry_field(minute, 60, carry);
+    return ms_carry_field(hour, 24, carry);
 }
 
 static MS_NOINLINE int
@@ -10254,55 +10626,23 @@ datetime_round_up_micros(
     int *year, int *month, int *day, int *hour,
     int *minute, int *second, int *microsecond
 ) {
-    ++*microsecond;
-    if (*microsecond == 1000000) {
-        *microsecond = 0;
-        ++*second;
-        if (*second == 60) {
-            *second = 0;
-            ++*minute;
-            if (*minute == 60) {
-                *minute = 0;
-                ++*hour;
-                if (*hour == 24) {
-                    *hour = 0;
-                    ++*day;
-                    if (*day == days_in_month(*year, *month) + 1) {
-                        ++*month;
-                        *day = 1;
-                        if (*month > 12) {
-                            *month = 1;
-                            ++*year;
-                            if (*year > 9999) return -1;
-                        }
-                    }
-                }
-            }
-        }
-    }
-    return 0;
+    int carry = ms_round_up_time_fields(hour, minute, second, microsecond);
+    /* Days and months are 1-based, so wrap to 1 */
+    int d = *day + carry;
+    carry = (d > days_in_month(*year, *month));
+    *day = carry ? 1 : d;
+    int m = *month + carry;
+    carry = (m > 12);
+    *month = carry ? 1 : m;
+    *year += carry;
+    return (*year > 9999) ? -1 : 0;
 }
 
 static MS_NOINLINE void
 time_round_up_micros(
     int *hour, int *minute, int *second, int *microsecond
 ) {
-    ++*microsecond;
-    if (*microsecond == 1000000) {
-        *microsecond = 0;
-        ++*second;
-        if (*second == 60) {
-            *second = 0;
-            ++*minute;
-            if (*minute == 60) {
-                *minute = 0;
-                ++*hour;
-                if (*hour == 24) {
-                    *hour = 0;
-                }
-            }
-        }
-    }
+    ms_round_up_time_fields(hour, minute, second, microsecond);
 }
 
 /* Days since 0001-01-01, the min value for python's datetime objects */
@@ -10441,6 +10781,169 @@ ms_read_fixint(const char *buf, int width, int *out) {
     return buf;
 }
 
+#if PY_LITTLE_ENDIAN
+/* Check that the 8 bytes in `w` match a fixed-width layout. Lanes set in
+ * `digits` must be ASCII digits, lanes set in `seps` must equal the same lane
+ * in `pattern`, all others are ignored. If they match, `*out` is set to the
+ * digit values (0-9) in the digit lanes, and 0 elsewhere. */
+static MS_INLINE bool
+ms_swar_match_fixed(
+    uint64_t w, uint64_t digits, uint64_t seps, uint64_t pattern, uint64_t *out
+) {
+    const uint64_t hi = 0xF0F0F0F0F0F0F0F0ULL & digits;
+    const uint64_t zeros = 0x3030303030303030ULL & digits;
+    /* Digits are 0x30-0x39: the high nibble is 3, and stays 3 after adding 6 */
+    uint64_t bad = (
+        ((w & hi) ^ zeros) |
+        ((((w & 0x7F7F7F7F7F7F7F7FULL) + 0x0606060606060606ULL) & hi) ^ zeros) |
+        ((w ^ pattern) & seps)
+    );
+    *out = (w & digits) - zeros;
+    return bad == 0;
+}
+
+/* Given digit values from `ms_swar_match_fixed`, combine each pair of
+ * adjacent digits. The two digit value starting at lane `i` ends up in lane
+ * `i` (as long as lane `i + 1` holds the low digit) */
+#define ms_swar_digit_pairs(v) ((v) * 10 + ((v) >> 8))
+
+#define ms_swar_lane(v, i) ((int)(((v) >> (8 * (i))) & 0xFF))
+#endif
+
+/* Parse the `YYYY-MM-DD` prefix of an RFC3339 date. Requires at least 10
+ * readable bytes. Returns true on success. Range checks are left to the
+ * caller. */
+static MS_INLINE bool
+ms_read_date_prefix(const char *buf, int *year, int *month, int *day) {
+#if PY_LITTLE_ENDIAN
+    uint64_t w, ymd, md;
+    /* `YYYY-MM-` */
+    memcpy(&w, buf, 8);
+    if (
+        !ms_swar_match_fixed(
+            w,
+            0x00FFFF00FFFFFFFFULL,
+            0xFF0000FF00000000ULL,
+            0x2D00002D00000000ULL,
+            &ymd
+        )
+    ) return false;
+    /* `YY-MM-DD`, only the last two lanes are new */
+    memcpy(&w, buf + 2, 8);
+    if (!ms_swar_match_fixed(w, 0xFFFF000000000000ULL, 0, 0, &md)) return false;
+    ymd = ms_swar_digit_pairs(ymd);
+    md = ms_swar_digit_pairs(md);
+    *year = ms_swar_lane(ymd, 0) * 100 + ms_swar_lane(ymd, 2);
+    *month = ms_swar_lane(ymd, 5);
+    *day = ms_swar_lane(md, 6);
+    return true;
+#else
+    if ((buf = ms_read_fixint(buf, 4, year)) == NULL) return false;
+    if (*buf++ != '-') return false;
+    if ((buf = ms_read_fixint(buf, 2, month)) == NULL) return false;
+    if (*buf++ != '-') return false;
+    return ms_read_fixint(buf, 2, day) != NULL;
+#endif
+}
+
+/* Parse the `hh:mm:ss` prefix of an RFC3339 time. Requires at least 8
+ * readable bytes. Returns true on success. Range checks are left to the
+ * caller. */
+static MS_INLINE bool
+ms_read_time_prefix(const char *buf, int *hour, int *minute, int *second) {
+#if PY_LITTLE_ENDIAN
+    uint64_t w, hms;
+    memcpy(&w, buf, 8);
+    if (
+        !ms_swar_match_fixed(
+            w,
+            0xFFFF00FFFF00FFFFULL,
+            0x0000FF0000FF0000ULL,
+            0x00003A00003A0000ULL,
+            &hms
+        )
+    ) return false;
+    hms = ms_swar_digit_pairs(hms);
+    *hour = ms_swar_lane(hms, 0);
+    *minute = ms_swar_lane(hms, 3);
+    *second = ms_swar_lane(hms, 6);
+    return true;
+#else
+    if ((buf = ms_read_fixint(buf, 2, hour)) == NULL) return false;
+    if (*buf++ != ':') return false;
+    if ((buf = ms_read_fixint(buf, 2, minute)) == NULL) return false;
+    if (*buf++ != ':') return false;
+    return ms_read_fixint(buf, 2, second) != NULL;
+#endif
+}
+
+/* Parse the digits of an RFC3339 fractional second, starting just after the
+ * '.' and ending at the first non-digit. The value is scaled to microseconds,
+ * with `*round_up` set if the digits past the sixth round it up. Requires at
+ * least 7 readable bytes before `buf`. Returns a pointer to the first
+ * non-digit, or NULL if there are no digits. */
+static MS_INLINE const char *
+ms_read_fraction(
+    const char *buf, const char *buf_end, int *microsecond, bool *round_up
+) {
+#if PY_LITTLE_ENDIAN
+    /* Load up to 8 bytes at once. Near the end of the input the last 8 bytes
+     * are loaded instead, and shifted so lanes past the end are 0. */
+    Py_ssize_t remaining = buf_end - buf;
+    if (remaining <= 0) return NULL;
+    uint64_t w;
+    if (remaining >= 8) {
+        memcpy(&w, buf, 8);
+    }
+    else {
+        memcpy(&w, buf_end - 8, 8);
+        w >>= 8 * (8 - remaining);
+    }
+    uint64_t low7 = w & 0x7F7F7F7F7F7F7F7FULL;
+    uint64_t ge_0 = low7 + 0x5050505050505050ULL;  /* lane >= '0' */
+    uint64_t gt_9 = low7 + 0x4646464646464646ULL;  /* lane > '9' */
+    uint64_t not_digit = (~ge_0 | gt_9 | w) & 0x8080808080808080ULL;
+    int ndigits = not_digit ? (ms_ctz64(not_digit) >> 3) : 8;
+    if (ndigits == 0) return NULL;
+
+    /* Keep (at most) the first 6 digits, then move them to the low 6 of 8
+     * lanes. Missing trailing digits are 0, scaling the result. */
+    int nkeep = ndigits < 6 ? ndigits : 6;
+    uint64_t v = (w - 0x3030303030303030ULL) & ((1ULL << (8 * nkeep)) - 1);
+    v <<= 16;
+    v = ms_swar_digit_pairs(v);
+    v = (
+        ((v & 0x000000FF000000FFULL) * 0x000F424000000064ULL) +
+        (((v >> 16) & 0x000000FF000000FFULL) * 0x0000271000000001ULL)
+    ) >> 32;
+    *microsecond = (int)v;
+    if (ndigits <= 6) return buf + ndigits;
+
+    /* Higher precision than microseconds; round on the next digit, then skip
+     * all remaining digits */
+    *round_up = ms_swar_lane(w, 6) >= '5';
+    buf += 7;
+    while (buf < buf_end && is_digit(*buf)) buf++;
+    return buf;
+#else
+    static const int pow10[6] = {100000, 10000, 1000, 100, 10, 1};
+    int ndigits = 0, micros = 0;
+    while (ndigits < 6 && buf < buf_end && is_digit(*buf)) {
+        micros = micros * 10 + (*buf++ - '0');
+        ndigits++;
+    }
+    if (ndigits == 0) return NULL;
+    *microsecond = micros * pow10[ndigits - 1];
+    if (buf < buf_end && is_digit(*buf)) {
+        /* Higher precision than microseconds; round on the next digit, then
+         * skip all remaining digits */
+        *round_up = *buf >= '5';
+        while (buf < buf_end && is_digit(*buf)) buf++;
+    }
+    return buf;
+#endif
+}
+
 /* Requires 10 bytes of scratch space */
 static void
 ms_encode_date(PyObject *obj, char *out)
@@ -10591,11 +11094,7 @@ ms_decode_date(const char *buf, Py_ssize_t size, PathNode *path) {
     if (size != 10) goto invalid;
 
     /* Parse date */
-    if ((buf = ms_read_fixint(buf, 4, &year)) == NULL) goto invalid;
-    if (*buf++ != '-') goto invalid;
-    if ((buf = ms_read_fixint(buf, 2, &month)) == NULL) goto invalid;
-    if (*buf++ != '-') goto invalid;
-    if ((buf = ms_read_fixint(buf, 2, &day)) == NULL) goto invalid;
+    if (!ms_read_date_prefix(buf, &year, &month, &day)) goto invalid;
 
     /* Ensure all numbers are valid */
     if (year == 0) goto invalid;
@@ -10620,43 +11119,18 @@ ms_decode_time(const char *buf, Py_ssize_t size, TypeNode *type, PathNode *path)
     if (size < 8) goto invalid;
 
     /* Parse time */
-    if ((buf = ms_read_fixint(buf, 2, &hour)) == NULL) goto invalid;
-    if (*buf++ != ':') goto invalid;
-    if ((buf = ms_read_fixint(buf, 2, &minute)) == NULL) goto invalid;
-    if (*buf++ != ':') goto invalid;
-    if ((buf = ms_read_fixint(buf, 2, &second)) == NULL) goto invalid;
+    if (!ms_read_time_prefix(buf, &hour, &minute, &second)) goto invalid;
+    buf += 8;
 
     /* Remaining reads require bounds check */
 #define next_or_null() (buf == buf_end) ? '\0' : *buf++
     c = next_or_null();
 
     if (c == '.') {
-        int ndigits = 0;
-        while (ndigits < 6) {
-            c = next_or_null();
-            if (!is_digit(c)) goto end_decimal;
-            ndigits++;
-            microsecond = microsecond * 10 + (c - '0');
-        }
-        c = next_or_null();
-        if (is_digit(c)) {
-            /* This timestamp has higher precision than microseconds; parse
-            * the next digit to support rounding, then skip all remaining
-            * digits */
-            if ((c - '0') >= 5) {
-                round_up_micros = true;
-            }
-            while (true) {
-                c = next_or_null();
-                if (!is_digit(c)) break;
-            }
-        }
-end_decimal:
+        buf = ms_read_fraction(buf, buf_end, &microsecond, &round_up_micros);
         /* Error if no digits after decimal */
-        if (ndigits == 0) goto invalid;
-        int pow10[6] = {100000, 10000, 1000, 100, 10, 1};
-        /* Scale microseconds appropriately */
-        microsecond *= pow10[ndigits - 1];
+        if (buf == NULL) goto invalid;
+        c = next_or_null();
     }
 #undef next_or_null
 
@@ -10774,11 +11248,8 @@ ms_decode_datetime_from_str(
     if (size < 19) goto invalid;
 
     /* Parse date */
-    if ((buf = ms_read_fixint(buf, 4, &year)) == NULL) goto invalid;
-    if (*buf++ != '-') goto invalid;
-    if ((buf = ms_read_fixint(buf, 2, &month)) == NULL) goto invalid;
-    if (*buf++ != '-') goto invalid;
-    if ((buf = ms_read_fixint(buf, 2, &day)) == NULL) goto invalid;
+    if (!ms_read_date_prefix(buf, &year, &month, &day)) goto invalid;
+    buf += 10;
 
     /* RFC3339 date/time separator can be T or t. We also support ' ', which is
      * ISO8601 compatible. */
@@ -10786,11 +11257,8 @@ ms_decode_datetime_from_str(
     if (!(c == 'T' || c == 't' || c == ' ')) goto invalid;
 
     /* Parse time */
-    if ((buf = ms_read_fixint(buf, 2, &hour)) == NULL) goto invalid;
-    if (*buf++ != ':') goto invalid;
-    if ((buf = ms_read_fixint(buf, 2, &minute)) == NULL) goto invalid;
-    if (*buf++ != ':') goto invalid;
-    if ((buf = ms_read_fixint(buf, 2, &second)) == NULL) goto invalid;
+    if (!ms_read_time_prefix(buf, &hour, &minute, &second)) goto invalid;
+    buf += 8;
 
     /* Remaining reads require bounds check */
 #define next_or_null() (buf == buf_end) ? '\0' : *buf++
@@ -10806,32 +11274,10 @@ ms_decode_datetime_from_str(
      * systems commonly accept 3 or 6 digits, support for/usage of nanosecond
      * precision is rare. */
     if (c == '.') {
-        int ndigits = 0;
-        while (ndigits < 6) {
-            c = next_or_null();
-            if (!is_digit(c)) goto end_decimal;
-            ndigits++;
-            microsecond = microsecond * 10 + (c - '0');
-        }
-        c = next_or_null();
-        if (is_digit(c)) {
-            /* This timestamp has higher precision than microseconds; parse
-            * the next digit to support rounding, then skip all remaining
-            * digits */
-            if ((c - '0') >= 5) {
-                round_up_micros = true;
-            }
-            while (true) {
-                c = next_or_null();
-                if (!is_digit(c)) break;
-            }
-        }
-end_decimal:
+        buf = ms_read_fraction(buf, buf_end, &microsecond, &round_up_micros);
         /* Error if no digits after decimal */
-        if (ndigits == 0) goto invalid;
-        int pow10[6] = {100000, 10000, 1000, 100, 10, 1};
-        /* Scale microseconds appropriately */
-        microsecond *= pow10[ndigits - 1];
+        if (buf == NULL) goto invalid;
+        c = next_or_null();
     }
 #undef next_or_null
 
@@ -11361,18 +11807,9 @@ ms_decode_uuid_from_str(const char *buf, Py_ssize_t size, PathNode *path) {
 
     for (int i = 0; i < 5; i++) {
         for (int j = 0; j < segments[i]; j++) {
-            char hi = *buf++;
-            if (hi >= '0' && hi <= '9') { hi -= '0'; }
-            else if (hi >= 'a' && hi <= 'f') { hi = hi - 'a' + 10; }
-            else if (hi >= 'A' && hi <= 'F') { hi = hi - 'A' + 10; }
-            else { goto invalid; }
-
-            char lo = *buf++;
-            if (lo >= '0' && lo <= '9') { lo -= '0'; }
-            else if (lo >= 'a' && lo <= 'f') { lo = lo - 'a' + 10; }
-            else if (lo >= 'A' && lo <= 'F') { lo = lo - 'A' + 10; }
-            else { goto invalid; }
-
+            int8_t hi = hex_decode_table[(uint8_t)*buf++];
+            int8_t lo = hex_decode_table[(uint8_t)*buf++];
+            if ((hi | lo) < 0) goto invalid;
             *decoded++ = ((unsigned char)hi << 4) + (unsigned char)lo;
         }
         if (has_hyphens && i < 4 && *buf++ != '-') goto invalid;
@@ -11644,6 +12081,111 @@ ms_post_decode_float(
 #define ONE_E18 1000000000000000000ULL
 #define ONE_E19_MINUS_ONE 9999999999999999999ULL
 
+/* Consume as many complete runs of 8 ASCII digits as possible starting at
+ * `p`, accumulating them into `*mantissa`. Returns a pointer to the first
+ * unconsumed byte; any trailing digits are left for the caller's scalar loop.
+ *
+ * The digit check and conversion are SWAR routines adapted from fast_float
+ * (https://github.com/fastfloat/fast_float), and rely on a little-endian
+ * load. On other platforms this is a no-op. As with the scalar loops, the
+ * mantissa may silently wrap for inputs longer than 19 digits - callers are
+ * responsible for detecting overflow from the digit count. */
+static MS_INLINE const unsigned char *
+parse_8_digit_runs(
+    const unsigned char *p, const unsigned char *pend, uint64_t *mantissa
+) {
+#if PY_LITTLE_ENDIAN
+    uint64_t m = *mantissa;
+    while (pend - p >= 8) {
+        uint64_t v;
+        memcpy(&v, p, 8);
+        /* Check all 8 bytes are in '0'-'9' */
+        if (
+            ((v & 0xF0F0F0F0F0F0F0F0ULL) |
+             (((v + 0x0606060606060606ULL) & 0xF0F0F0F0F0F0F0F0ULL) >> 4))
+            != 0x3333333333333333ULL
+        ) break;
+        /* Combine digit pairs, then pairs of pairs, then the two halves */
+        v -= 0x3030303030303030ULL;
+        v = (v * 10) + (v >> 8);
+        v = (
+            ((v & 0x000000FF000000FFULL) * 0x000F424000000064ULL) +
+            (((v >> 16) & 0x000000FF000000FFULL) * 0x0000271000000001ULL)
+        ) >> 32;
+        m = m * 100000000 + (uint32_t)v;
+        p += 8;
+    }
+    *mantissa = m;
+#endif
+    return p;
+}
+
+/* Consume up to `max_digits` (at most 8) leading ASCII digits starting at `p`
+ * in one step, accumulating them into `*mantissa`. Requires at least 8
+ * readable bytes at `p`. Returns a pointer to the first unconsumed byte.
+ *
+ * Each byte is classified as a digit or not without carries between lanes,
+ * the digit count is found from the first non-digit lane, and the digits are
+ * shifted up to fill a whole block (the vacated low lanes act as leading
+ * zeros) before the same reduction as `parse_8_digit_runs`. Like that
+ * routine this relies on a little-endian load, and is a no-op elsewhere. */
+static MS_INLINE const unsigned char *
+parse_1_to_8_digits(
+    const unsigned char *p, size_t max_digits, uint64_t *mantissa
+) {
+#if PY_LITTLE_ENDIAN
+    static const uint32_t pow10[9] = {
+        1, 10, 100, 1000, 10000, 100000, 1000000, 10000000, 100000000
+    };
+    uint64_t v;
+    memcpy(&v, p, 8);
+    uint64_t low7 = v & 0x7F7F7F7F7F7F7F7FULL;
+    uint64_t ge_0 = low7 + 0x5050505050505050ULL;  /* lane >= '0' */
+    uint64_t gt_9 = low7 + 0x4646464646464646ULL;  /* lane > '9' */
+    uint64_t not_digit = (~ge_0 | gt_9 | v) & 0x8080808080808080ULL;
+    size_t n = not_digit ? (ms_ctz64(not_digit) >> 3) : 8;
+    if (n > max_digits) n = max_digits;
+    if (n == 0) return p;
+    /* Lanes above the digits may borrow here, but are shifted out below */
+    v -= 0x3030303030303030ULL;
+    v <<= 8 * (8 - n);
+    v = (v * 10) + (v >> 8);
+    v = (
+        ((v & 0x000000FF000000FFULL) * 0x000F424000000064ULL) +
+        (((v >> 16) & 0x000000FF000000FFULL) * 0x0000271000000001ULL)
+    ) >> 32;
+    *mantissa = *mantissa * pow10[n] + (uint32_t)v;
+    p += n;
+#endif
+    return p;
+}
+
+/* Skip a run of '0' characters, returning a pointer to the first other
+ * character (or `end`). Used for the long runs of digits that only need
+ * checking for zero in `parse_number_fallback`. */
+static const unsigned char *
+skip_zero_digits(const unsigned char *p, const unsigned char *end) {
+#if MS_HAVE_SSE2
+    const __m128i zero = _mm_set1_epi8('0');
+    while (end - p >= 16) {
+        __m128i v = _mm_loadu_si128((const __m128i *)p);
+        uint32_t mask = (~(uint32_t)_mm_movemask_epi8(_mm_cmpeq_epi8(v, zero))) & 0xFFFF;
+        if (mask != 0) return p + ms_ctz(mask);
+        p += 16;
+    }
+#elif PY_LITTLE_ENDIAN
+    while (end - p >= 8) {
+        uint64_t v;
+        memcpy(&v, p, 8);
+        v ^= 0x3030303030303030ULL;
+        if (v != 0) return p + (ms_ctz64(v) >> 3);
+        p += 8;
+    }
+#endif
+    while (p < end && *p == '0') p++;
+    return p;
+}
+
 static MS_NOINLINE PyObject *
 parse_number_fallback(
     const unsigned char* integer_start,
@@ -11669,38 +12211,35 @@ parse_number_fallback(
     /* Parse integer */
     const unsigned char *p = integer_start;
     if (*p != '0') {
-        while (p < integer_end) {
-            if (MS_LIKELY(nd < MS_HPD_MAX_DIGITS)) {
-                dec.digits[nd++] = (uint8_t)(*p - '0');
-            }
-            else if (*p != '0') {
+        while (p < integer_end && MS_LIKELY(nd < MS_HPD_MAX_DIGITS)) {
+            dec.digits[nd++] = (uint8_t)(*p - '0');
+            p++;
+        }
+        dp = nd;
+        /* Digits beyond the max are only checked for truncation */
+        if (p < integer_end) {
+            dp += integer_end - p;
+            if (skip_zero_digits(p, integer_end) != integer_end) {
                 dec.truncated = true;
             }
-            dp++;
-            p++;
         }
     }
 
     p = fraction_start;
-    while (p < fraction_end) {
-        if (*p == '0') {
-            if (nd == 0) {
-                /* Track leading zeros implicitly */
-                dp--;
-            }
-            else if (nd < MS_HPD_MAX_DIGITS) {
-                dec.digits[nd++] = (uint8_t)(*p - '0');
-            }
+    if (p != NULL) {
+        if (nd == 0) {
+            /* Track leading zeros implicitly */
+            const unsigned char *nonzero = skip_zero_digits(p, fraction_end);
+            dp -= nonzero - p;
+            p = nonzero;
+        }
+        while (p < fraction_end && MS_LIKELY(nd < MS_HPD_MAX_DIGITS)) {
+            dec.digits[nd++] = (uint8_t)(*p - '0');
+            p++;
         }
-        else if ('1' <= *p && *p <= '9') {
-            if (nd < MS_HPD_MAX_DIGITS) {
-                dec.digits[nd++] = (uint8_t)(*p - '0');
-            }
-            else {
-                dec.truncated = true;
-            }
+        if (p < fraction_end && skip_zero_digits(p, fraction_end) != fraction_end) {
+            dec.truncated = true;
         }
-        p++;
     }
 
     dp += exp_part;
@@ -11794,6 +12333,13 @@ static MS_NOINLINE PyObject *
 json_float_hook(
     const char *buf, Py_ssize_t size, PathNode *path, PyObject *float_hook
 ) {
+    MsgspecState *mod = msgspec_get_global_state();
+    if (float_hook == mod->DecimalType) {
+        /* `float_hook=decimal.Decimal` is common enough to special case. The
+         * raw JSON number is always a valid decimal literal, so it can be
+         * handed straight to the same path used for `Decimal` typed fields. */
+        return ms_decode_decimal(buf, size, true, path, mod);
+    }
     PyObject *str = PyUnicode_New(size, 127);
     if (str == NULL) return NULL;
     memcpy(ascii_get_buffer(str), buf, size);
@@ -11844,12 +12390,12 @@ parse_number_inline(
         if (MS_UNLIKELY(p != pend && is_digit(*p))) goto invalid_number;
     }
     else {
-        unsigned char c = *p;
-        while (MS_LIKELY(is_digit(c))) {
-            mantissa = mantissa * 10 + (uint8_t)(c - '0');
+        p = parse_8_digit_runs(p, pend, &mantissa);
+        /* Consume any shorter trailing run of digits at once */
+        if (pend - p >= 8) p = parse_1_to_8_digits(p, 8, &mantissa);
+        while (MS_LIKELY(p != pend && is_digit(*p))) {
+            mantissa = mantissa * 10 + (uint8_t)(*p - '0');
             p++;
-            if (MS_UNLIKELY(p == pend)) break;
-            c = *p;
         }
         /* There must be at least one digit */
         if (MS_UNLIKELY(integer_start == p)) {
@@ -11878,6 +12424,11 @@ parse_number_inline(
 
         /* Parse fraction */
         fraction_start = p;
+        /* Leading zeros only affect the exponent, which is computed from
+         * positions below - skip them in bulk */
+        if (mantissa == 0) p = skip_zero_digits(p, pend);
+        p = parse_8_digit_runs(p, pend, &mantissa);
+        if (pend - p >= 8) p = parse_1_to_8_digits(p, 8, &mantissa);
         while (MS_LIKELY(p != pend && is_digit(*p))) {
             mantissa = mantissa * 10 + (uint8_t)(*p - '0');
             p++;
@@ -11928,12 +12479,13 @@ parse_number_inline(
 end_parsing:
     /* Check for overflow and maybe reparse if needed */
     if (MS_UNLIKELY(digit_count > 19)) {
-        const unsigned char *cur = integer_start;
-        while ((cur != pend) && (*cur == '0' || *cur == '.')) {
-            if (*cur == '0') {
-                digit_count--;
-            }
-            cur++;
+        /* Leading zeros (including those after the decimal point) aren't
+         * significant, and may be long runs for tiny floats */
+        const unsigned char *first_nonzero = skip_zero_digits(integer_start, integer_end);
+        digit_count -= first_nonzero - integer_start;
+        if (first_nonzero == integer_end && fraction_start != NULL) {
+            first_nonzero = skip_zero_digits(fraction_start, fraction_end);
+            digit_count -= first_nonzero - fraction_start;
         }
 
         if (
@@ -11957,7 +12509,9 @@ end_parsing:
                 exponent = integer_end - cur + exp_part;
             }
             else {
-                cur = fraction_start;
+                /* A zero integer part means the leading fractional zeros
+                 * were already skipped above */
+                cur = (mantissa == 0) ? first_nonzero : fraction_start;
                 while ((mantissa < ONE_E18) && (cur != fraction_end)) {
                     mantissa = mantissa * 10 + (uint64_t)(*cur - '0');
                     cur++;
@@ -12004,8 +12558,20 @@ end_parsing:
     else if (MS_UNLIKELY(float_hook != NULL && type->types & MS_TYPE_ANY)) {
         return json_float_hook((char *)start, p - start, path, float_hook);
     }
+    else if (
+        MS_UNLIKELY(
+            !(type->types & (MS_TYPE_ANY | MS_TYPE_FLOAT)) &&
+            (strict || !(type->types & (MS_TYPE_INT | MS_TYPE_DATETIME | MS_TYPE_TIMEDELTA))) &&
+            exponent <= 289
+        )
+    ) {
+        /* The value can't be accepted as a float, error without computing
+         * it. Larger exponents may be out of range, which is reported
+         * instead; the mantissa is < 1e19, so `exponent <= 289` can't be */
+        return ms_validation_error(from_str ? "str" : "float", type, path);
+    }
     else {
-        if (MS_UNLIKELY(exponent > 288 || exponent < -307)) {
+        if (MS_UNLIKELY(exponent > 308 || exponent < -342)) {
             /* Exponent is out of bounds */
             goto fallback;
         }
@@ -12021,6 +12587,16 @@ end_parsing:
                 val /= ms_atof_f64_powers_of_10[-exponent];
             }
         }
+        else if (
+            (22 < exponent) && (exponent <= 22 + 15) &&
+            (mantissa <= ((1ull << 53) - 1) / (uint64_t)ms_atof_f64_powers_of_10[exponent - 22])
+        ) {
+            /* If the excess exponent can be moved into the mantissa without
+             * the mantissa losing exactness, we can still take the fast path
+             * (e.g. `12e30` is computed as `12e8 * 1e22`) */
+            val = (double)(mantissa * (uint64_t)ms_atof_f64_powers_of_10[exponent - 22]);
+            val *= ms_atof_f64_powers_of_10[22];
+        }
         else if (MS_UNLIKELY(mantissa == 0)) {
             /* Special case 0 handling. This is only hit if the mantissa is 0
              * and the exponent is out of bounds above (i.e. rarely) */
@@ -13401,6 +13977,77 @@ static const char escape_table[256] = {
     0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
 };
 
+/* Helpers for scanning JSON strings for the bytes that end a run of plain
+ * characters, used by both the encoder and decoder */
+#if MS_HAVE_SSE2
+/* Bitmask of the bytes in `p[0:16]` that are `"`, `\`, forbidden control
+ * characters, or non-ascii */
+static MS_INLINE uint32_t
+json_special_or_nonascii_mask16(const unsigned char *p) {
+    __m128i v = _mm_loadu_si128((const __m128i *)p);
+    __m128i out = _mm_or_si128(
+        _mm_or_si128(
+            _mm_cmpeq_epi8(v, _mm_set1_epi8('"')),
+            _mm_cmpeq_epi8(v, _mm_set1_epi8('\\'))
+        ),
+        /* A signed compare, so also true for all bytes >= 0x80 */
+        _mm_cmplt_epi8(v, _mm_set1_epi8(0x20))
+    );
+    return _mm_movemask_epi8(out);
+}
+
+/* Bitmask of the bytes in `p[0:16]` that are `"`, `\`, or forbidden control
+ * characters */
+static MS_INLINE uint32_t
+json_special_mask16(const unsigned char *p) {
+    __m128i v = _mm_loadu_si128((const __m128i *)p);
+    __m128i out = _mm_or_si128(
+        _mm_or_si128(
+            _mm_cmpeq_epi8(v, _mm_set1_epi8('"')),
+            _mm_cmpeq_epi8(v, _mm_set1_epi8('\\'))
+        ),
+        /* Unsigned `v <= 0x1F` */
+        _mm_cmpeq_epi8(
+            _mm_subs_epu8(v, _mm_set1_epi8(0x1F)), _mm_setzero_si128()
+        )
+    );
+    return _mm_movemask_epi8(out);
+}
+#elif PY_LITTLE_ENDIAN
+/* Portable SWAR fallbacks, checking 8 bytes at a time. Each term below sets
+ * the high bit of every byte matching its condition. Borrows may also set
+ * bits in bytes *after* a match, but never before one, so the lowest set bit
+ * always marks the first matching byte. */
+#define SWAR_ONES 0x0101010101010101ULL
+#define SWAR_HIGH 0x8080808080808080ULL
+
+/* Bitmask with the high bit set in the bytes of `p[0:8]` that are `"`, `\`,
+ * or forbidden control characters */
+static MS_INLINE uint64_t
+json_special_mask8(const unsigned char *p) {
+    uint64_t v, q, b;
+    memcpy(&v, p, 8);
+    q = v ^ (SWAR_ONES * '"');
+    b = v ^ (SWAR_ONES * '\\');
+    return (
+        ((q - SWAR_ONES) & ~q) |
+        ((b - SWAR_ONES) & ~b) |
+        ((v - SWAR_ONES * 0x20) & ~v)
+    ) & SWAR_HIGH;
+}
+
+/* Same as above, but also including non-ascii bytes */
+static MS_INLINE uint64_t
+json_special_or_nonascii_mask8(const unsigned char *p) {
+    uint64_t v;
+    memcpy(&v, p, 8);
+    return json_special_mask8(p) | (v & SWAR_HIGH);
+}
+
+#undef SWAR_ONES
+#undef SWAR_HIGH
+#endif
+
 static int
 json_str_requires_escaping(PyObject *obj) {
     Py_ssize_t i, len;
@@ -13427,6 +14074,36 @@ json_encode_cstr_inline(EncoderState *self, const char *src, Py_ssize_t len) {
 
 noescape:
 
+#if MS_HAVE_SSE2
+    while (src_end - src >= 16) {
+        uint32_t mask = json_special_mask16((const unsigned char *)src);
+        if (mask != 0) {
+            size_t n = ms_ctz(mask);
+            memcpy(out, src, n);
+            out += n;
+            src += n;
+            goto escape;
+        }
+        memcpy(out, src, 16);
+        out += 16;
+        src += 16;
+    }
+#elif PY_LITTLE_ENDIAN
+    while (src_end - src >= 8) {
+        uint64_t mask = json_special_mask8((const unsigned char *)src);
+        if (mask != 0) {
+            size_t n = ms_ctz64(mask) >> 3;
+            memcpy(out, src, n);
+            out += n;
+            src += n;
+            goto escape;
+        }
+        memcpy(out, src, 8);
+        out += 8;
+        src += 8;
+    }
+#endif
+
 #define write_ascii_pre(i) \
     if (MS_UNLIKELY(escape_table[(uint8_t)src[i]])) goto write_ascii_##i;
 
@@ -13510,11 +14187,21 @@ json_encode_cstr_noescape(EncoderState *self, const char *str, Py_ssize_t size)
     return 0;
 }
 
-static inline int
-json_encode_str_noescape(EncoderState *self, PyObject *obj) {
+/* Write an object key that is known not to need escaping, followed by the
+ * `:` separator, in a single write. Used for struct field names. */
+static MS_INLINE int
+json_encode_key_noescape(EncoderState *self, PyObject *obj) {
     Py_ssize_t len;
-    const char* buf = unicode_str_and_size_nocheck(obj, &len);
-    return json_encode_cstr_noescape(self, buf, len);
+    const char *buf = unicode_str_and_size_nocheck(obj, &len);
+    if (ms_ensure_space(self, len + 3) < 0) return -1;
+    char *p = self->output_buffer_raw + self->output_len;
+    *p++ = '"';
+    memcpy(p, buf, len);
+    p += len;
+    *p++ = '"';
+    *p = ':';
+    self->output_len += len + 3;
+    return 0;
 }
 
 static int
@@ -14064,8 +14751,7 @@ json_encode_struct_object(
         val = Struct_get_index(obj, i);
         if (MS_UNLIKELY(val == NULL)) goto cleanup;
         if (MS_UNLIKELY(val == UNSET)) continue;
-        if (json_encode_str_noescape(self, key) < 0) goto cleanup;
-        if (ms_write(self, ":", 1) < 0) goto cleanup;
+        if (json_encode_key_noescape(self, key) < 0) goto cleanup;
         if (json_encode(self, val) < 0) goto cleanup;
         if (ms_write(self, ",", 1) < 0) goto cleanup;
     }
@@ -14076,8 +14762,7 @@ json_encode_struct_object(
         if (MS_UNLIKELY(val == UNSET)) continue;
         PyObject *default_val = PyTuple_GET_ITEM(defaults, i - nunchecked);
         if (!is_default(val, default_val)) {
-            if (json_encode_str_noescape(self, key) < 0) goto cleanup;
-            if (ms_write(self, ":", 1) < 0) goto cleanup;
+            if (json_encode_key_noescape(self, key) < 0) goto cleanup;
             if (json_encode(self, val) < 0) goto cleanup;
             if (ms_write(self, ",", 1) < 0) goto cleanup;
         }
@@ -15209,6 +15894,7 @@ mpack_decode_fixtuple(
         return NULL; /* cpylint-ignore */
     }
 
+    bool should_untrack = true;
     for (i = 0; i < fixtuple_size; i++) {
         PathNode el_path = {path, i};
         item = mpack_decode(self, type->details[offset + i].pointer, &el_path, is_key);
@@ -15217,8 +15903,12 @@ mpack_decode_fixtuple(
             break;
         }
         PyTuple_SET_ITEM(res, i, item);
+        if (should_untrack) {
+            should_untrack = !MS_MAYBE_TRACKED(item);
+        }
     }
     Py_LeaveRecursiveCall();
+    if (res != NULL && should_untrack) PyObject_GC_UnTrack(res);
     return res;
 }
 
@@ -15296,7 +15986,7 @@ mpack_ensure_tag_matches(
         const char *expected_str = unicode_str_and_size_nocheck(
             expected_tag, &expected_size
         );
-        if (tag_size != expected_size || memcmp(tag, expected_str, expected_size) != 0) {
+        if (tag_size != expected_size || !ms_memeq(tag, expected_str, expected_size)) {
             /* Tag doesn't match the expected value, error nicely */
             ms_invalid_cstr_value(tag, tag_size, path);
             return -1;
@@ -15374,14 +16064,8 @@ mpack_decode_struct_array_inner(
     nrequired = tagged + nfields - st_type->n_trailing_defaults;
     npos = nfields - ndefaults;
 
-    if (size < nrequired) {
-        ms_raise_validation_error(
-            path,
-            "Expected `array` of at least length %zd, got %zd%U",
-            nrequired,
-            size
-        );
-        return NULL;
+    if (MS_UNLIKELY(size < nrequired)) {
+        return ms_error_array_too_short(nrequired, size, path);
     }
 
     if (tagged) {
@@ -15546,6 +16230,12 @@ mpack_decode_key(DecoderState *self, TypeNode *type, PathNode *path) {
         char *str;
         if (MS_UNLIKELY(mpack_read(self, &str, size) < 0)) return NULL;
 
+        if (size == 1 && (unsigned char)*str < 128) {
+            /* CPython keeps singletons for all 1 character latin-1 strings,
+             * no need to hash or allocate */
+            return PyUnicode_FromOrdinal((unsigned char)*str);
+        }
+
         /* Attempt a cache lookup. We don't know if it's ascii yet, but
          * checking if it's ascii is more expensive than just doing a lookup,
          * and most dict key strings are ascii */
@@ -15556,7 +16246,7 @@ mpack_decode_key(DecoderState *self, TypeNode *type, PathNode *path) {
         if (MS_LIKELY(existing != NULL)) {
             Py_ssize_t e_size = ((PyASCIIObject *)existing)->length;
             char *e_str = ascii_get_buffer(existing);
-            if (MS_LIKELY(size == e_size && memcmp(str, e_str, size) == 0)) {
+            if (MS_LIKELY(size == e_size && ms_memeq(str, e_str, size))) {
                 Py_INCREF(existing);
                 return existing;
             }
@@ -15801,7 +16491,7 @@ mpack_decode_struct_union(
         key_size = mpack_decode_cstr(self, &key, &key_path);
         if (key_size < 0) return NULL;
 
-        if (key_size == tag_field_size && memcmp(key, tag_field, key_size) == 0) {
+        if (key_size == tag_field_size && ms_memeq(key, tag_field, key_size)) {
             /* Decode and lookup tag */
             PathNode tag_path = {path, PATH_STR, Lookup_tag_field(lookup)};
             StructInfo *info = mpack_decode_tag_and_lookup_type(self, lookup, &tag_path);
@@ -16268,6 +16958,7 @@ msgspec_msgpack_decode(PyObject *self, PyObject *const *args, Py_ssize_t nargs,
      * everything else on the heap */
     TypeNode typenode_any = {MS_TYPE_ANY};
     TypeNodeSimple typenode_struct;
+    PyObject *type_info = NULL;
     if (type == NULL || type == mod->typing_any) {
         state.type = &typenode_any;
     }
@@ -16280,8 +16971,9 @@ msgspec_msgpack_decode(PyObject *self, PyObject *const *args, Py_ssize_t nargs,
         state.type = (TypeNode *)(&typenode_struct);
     }
     else {
-        state.type = TypeNode_Convert(type);
-        if (state.type == NULL) return NULL;
+        type_info = TypeNodeInfo_Convert(type);
+        if (type_info == NULL) return NULL;
+        state.type = ((TypeNodeInfo *)type_info)->type;
     }
 
     Py_buffer buffer;
@@ -16302,7 +16994,7 @@ msgspec_msgpack_decode(PyObject *self, PyObject *const *args, Py_ssize_t nargs,
         Py_DECREF(typenode_struct.details[0].pointer);
     }
     else if (state.type != &typenode_any) {
-        TypeNode_Free(state.type);
+        Py_DECREF(type_info);
     }
     return res;
 }
@@ -16485,6 +17177,74 @@ json_peek_or_null(JSONDecoderState *self) {
     return *self->input_pos;
 }
 
+#define json_is_ws(c) ((c) == ' ' || (c) == '\n' || (c) == '\r' || (c) == '\t')
+
+#if MS_HAVE_SSE2
+#define JSON_WS_WIDE 16
+/* Skip a run of whitespace 16 bytes at a time. Returns a pointer to the first
+ * non-whitespace character, or to a position with fewer than 16 bytes left
+ * before `end` (the remainder is left for the caller to handle). */
+static MS_NOINLINE unsigned char *
+json_skip_ws_wide(unsigned char *p, unsigned char *end) {
+    const __m128i space = _mm_set1_epi8(' ');
+    const __m128i newline = _mm_set1_epi8('\n');
+    const __m128i cr = _mm_set1_epi8('\r');
+    const __m128i tab = _mm_set1_epi8('\t');
+    while (end - p >= 16) {
+        __m128i v = _mm_loadu_si128((const __m128i *)p);
+        __m128i ws = _mm_or_si128(
+            _mm_or_si128(_mm_cmpeq_epi8(v, space), _mm_cmpeq_epi8(v, newline)),
+            _mm_or_si128(_mm_cmpeq_epi8(v, cr), _mm_cmpeq_epi8(v, tab))
+        );
+        uint32_t mask = (~(uint32_t)_mm_movemask_epi8(ws)) & 0xFFFF;
+        if (mask != 0) return p + ms_ctz(mask);
+        p += 16;
+    }
+    return p;
+}
+#elif PY_LITTLE_ENDIAN
+#define JSON_WS_WIDE 8
+/* Set the high bit of every zero byte in `x`. Unlike the cheaper
+ * `(x - 0x01..) & ~x` form no borrows cross between bytes, so every byte is
+ * classified exactly. */
+#define swar_zero_bytes(x) \
+    (~((((x) & 0x7F7F7F7F7F7F7F7FULL) + 0x7F7F7F7F7F7F7F7FULL) | (x) | 0x7F7F7F7F7F7F7F7FULL))
+
+/* Same as above, 8 bytes at a time using SWAR */
+static MS_NOINLINE unsigned char *
+json_skip_ws_wide(unsigned char *p, unsigned char *end) {
+    const uint64_t ones = 0x0101010101010101ULL;
+    while (end - p >= 8) {
+        uint64_t v;
+        memcpy(&v, p, 8);
+        uint64_t ws = (
+            swar_zero_bytes(v ^ (ones * ' ')) |
+            swar_zero_bytes(v ^ (ones * '\n')) |
+            swar_zero_bytes(v ^ (ones * '\r')) |
+            swar_zero_bytes(v ^ (ones * '\t'))
+        );
+        uint64_t mask = ~ws & 0x8080808080808080ULL;
+        if (mask != 0) return p + (ms_ctz64(mask) >> 3);
+        p += 8;
+    }
+    return p;
+}
+#undef swar_zero_bytes
+#endif
+
+/* Called after consuming a single whitespace character. Single whitespace
+ * characters (e.g. `", "`) are common and cheap to handle byte-by-byte;
+ * longer runs (indentation) are skipped in bulk */
+static MS_INLINE unsigned char *
+json_skip_ws_run(unsigned char *p, unsigned char *end) {
+#ifdef JSON_WS_WIDE
+    if (end - p >= JSON_WS_WIDE && json_is_ws(*p)) {
+        return json_skip_ws_wide(p, end);
+    }
+#endif
+    return p;
+}
+
 static MS_INLINE bool
 json_peek_skip_ws(JSONDecoderState *self, unsigned char *s)
 {
@@ -16494,11 +17254,12 @@ json_peek_skip_ws(JSONDecoderState *self, unsigned char *s)
             return false;
         }
         unsigned char c = *self->input_pos;
-        if (MS_LIKELY(c != ' ' && c != '\n' && c != '\r' && c != '\t')) {
+        if (MS_LIKELY(!json_is_ws(c))) {
             *s = c;
             return true;
         }
         self->input_pos++;
+        self->input_pos = json_skip_ws_run(self->input_pos, self->input_end);
     }
 }
 
@@ -16525,10 +17286,11 @@ json_has_trailing_characters(JSONDecoderState *self)
 {
     while (self->input_pos != self->input_end) {
         unsigned char c = *self->input_pos++;
-        if (MS_UNLIKELY(!(c == ' ' || c == '\n' || c == '\t' || c == '\r'))) {
+        if (MS_UNLIKELY(!json_is_ws(c))) {
             json_err_invalid(self, "trailing characters");
             return true;
         }
+        self->input_pos = json_skip_ws_run(self->input_pos, self->input_end);
     }
     return false;
 }
@@ -16539,6 +17301,10 @@ static PyObject * json_decode(
     JSONDecoderState *self, TypeNode *type, PathNode *path
 );
 
+static PyObject * json_maybe_decode_number(
+    JSONDecoderState *self, TypeNode *type, PathNode *path
+);
+
 static PyObject *
 json_decode_none(JSONDecoderState *self, TypeNode *type, PathNode *path) {
     self->input_pos++;  /* Already checked as 'n' */
@@ -16681,21 +17447,11 @@ static MS_INLINE bool char_is_special(unsigned char c) {
 
 static int
 json_read_codepoint(JSONDecoderState *self, unsigned int *out) {
-    unsigned char c;
     unsigned int cp = 0;
     if (!json_remaining(self, 4)) return ms_err_truncated();
     for (int i = 0; i < 4; i++) {
-        c = *self->input_pos++;
-        if (c >= '0' && c <= '9') {
-            c -= '0';
-        }
-        else if (c >= 'a' && c <= 'f') {
-            c = c - 'a' + 10;
-        }
-        else if (c >= 'A' && c <= 'F') {
-            c = c - 'A' + 10;
-        }
-        else {
+        int8_t c = hex_decode_table[*self->input_pos++];
+        if (MS_UNLIKELY(c < 0)) {
             json_err_invalid(self, "invalid character in unicode escape");
             return -1;
         }
@@ -16755,6 +17511,51 @@ json_handle_unicode_escape(JSONDecoderState *self) {
     return 0;
 }
 
+#if MS_HAVE_SSE2
+#define parse_ascii_wide() \
+    while (self->input_end - self->input_pos >= 16) { \
+        uint32_t mask = json_special_or_nonascii_mask16(self->input_pos); \
+        if (mask != 0) { \
+            self->input_pos += ms_ctz(mask); \
+            goto parse_ascii_end; \
+        } \
+        self->input_pos += 16; \
+    }
+
+#define parse_unicode_wide() \
+    while (self->input_end - self->input_pos >= 16) { \
+        uint32_t mask = json_special_mask16(self->input_pos); \
+        if (mask != 0) { \
+            self->input_pos += ms_ctz(mask); \
+            goto parse_unicode_end; \
+        } \
+        self->input_pos += 16; \
+    }
+#elif PY_LITTLE_ENDIAN
+#define parse_ascii_wide() \
+    while (self->input_end - self->input_pos >= 8) { \
+        uint64_t mask = json_special_or_nonascii_mask8(self->input_pos); \
+        if (mask != 0) { \
+            self->input_pos += ms_ctz64(mask) >> 3; \
+            goto parse_ascii_end; \
+        } \
+        self->input_pos += 8; \
+    }
+
+#define parse_unicode_wide() \
+    while (self->input_end - self->input_pos >= 8) { \
+        uint64_t mask = json_special_mask8(self->input_pos); \
+        if (mask != 0) { \
+            self->input_pos += ms_ctz64(mask) >> 3; \
+            goto parse_unicode_end; \
+        } \
+        self->input_pos += 8; \
+    }
+#else
+#define parse_ascii_wide()
+#define parse_unicode_wide()
+#endif
+
 #define parse_ascii_pre(i) \
     if (MS_UNLIKELY(char_is_special_or_nonascii(self->input_pos[i]))) goto parse_ascii_##i;
 
@@ -16861,6 +17662,7 @@ top:
     }
 
     /* Loop until `"`, `\`, or a non-ascii character */
+    parse_ascii_wide();
     while (self->input_end - self->input_pos >= 8) {
         repeat8(parse_ascii_pre);
         self->input_pos += 8;
@@ -16879,6 +17681,7 @@ parse_ascii_end:
     if (MS_UNLIKELY(*self->input_pos & 0x80)) {
         *is_ascii = false;
         /* Loop until `"` or `\` */
+        parse_unicode_wide();
         while (self->input_end - self->input_pos >= 8) {
             repeat8(parse_unicode_pre);
             self->input_pos += 8;
@@ -16901,6 +17704,7 @@ json_decode_string_view(JSONDecoderState *self, char **out, bool *is_ascii) {
     unsigned char *start = self->input_pos;
 
     /* Loop until `"`, `\`, or a non-ascii character */
+    parse_ascii_wide();
     while (self->input_end - self->input_pos >= 8) {
         repeat8(parse_ascii_pre);
         self->input_pos += 8;
@@ -16926,6 +17730,7 @@ parse_ascii_end:
     if (MS_UNLIKELY(*self->input_pos & 0x80)) {
         *is_ascii = false;
         /* Loop until `"` or `\` */
+        parse_unicode_wide();
         while (self->input_end - self->input_pos >= 8) {
             repeat8(parse_unicode_pre);
             self->input_pos += 8;
@@ -16958,6 +17763,7 @@ json_skip_string(JSONDecoderState *self) {
 
 parse_unicode:
     /* Loop until `"` or `\` */
+    parse_unicode_wide();
     while (self->input_end - self->input_pos >= 8) {
         repeat8(parse_unicode_pre);
         self->input_pos += 8;
@@ -17036,6 +17842,8 @@ parse_unicode_end:
 #undef parse_ascii_post
 #undef parse_unicode_pre
 #undef parse_unicode_post
+#undef parse_ascii_wide
+#undef parse_unicode_wide
 
 /* A table of the corresponding base64 value for each character, or -1 if an
  * invalid character in the base64 alphabet (note the padding char '=' is
@@ -17140,8 +17948,16 @@ json_decode_string(JSONDecoderState *self, TypeNode *type, PathNode *path) {
     if (MS_LIKELY(type->types & (MS_TYPE_STR | MS_TYPE_ANY))) {
         PyObject *out;
         if (MS_LIKELY(is_ascii)) {
-            out = PyUnicode_New(size, 127);
-            memcpy(ascii_get_buffer(out), view, size);
+            if (size == 1) {
+                /* CPython keeps singletons for all 1 character latin-1
+                 * strings, no need to allocate */
+                out = PyUnicode_FromOrdinal((unsigned char)*view);
+            }
+            else {
+                out = PyUnicode_New(size, 127);
+                if (MS_UNLIKELY(out == NULL)) return NULL;
+                memcpy(ascii_get_buffer(out), view, size);
+            }
         }
         else {
             out = PyUnicode_DecodeUTF8(view, size, NULL);
@@ -17258,6 +18074,12 @@ json_decode_dict_key(JSONDecoderState *self, TypeNode *type, PathNode *path) {
         return json_decode_dict_key_fallback(self, view, size, is_ascii, type, path);
     }
 
+    if (size == 1) {
+        /* CPython keeps singletons for all 1 character latin-1 strings, no
+         * need to hash or allocate */
+        return PyUnicode_FromOrdinal((unsigned char)*view);
+    }
+
     uint32_t hash = murmur2(view, size);
     uint32_t index = hash % STRING_CACHE_SIZE;
     PyObject *existing = string_cache[index];
@@ -17265,7 +18087,7 @@ json_decode_dict_key(JSONDecoderState *self, TypeNode *type, PathNode *path) {
     if (MS_LIKELY(existing != NULL)) {
         Py_ssize_t e_size = ((PyASCIIObject *)existing)->length;
         char *e_str = ascii_get_buffer(existing);
-        if (MS_LIKELY(size == e_size && memcmp(view, e_str, size) == 0)) {
+        if (MS_LIKELY(size == e_size && ms_memeq(view, e_str, size))) {
             Py_INCREF(existing);
             return existing;
         }
@@ -17283,6 +18105,21 @@ json_decode_dict_key(JSONDecoderState *self, TypeNode *type, PathNode *path) {
     return new;
 }
 
+/* Decode an array item, where `c` is its already peeked first character.
+ * Strings and numbers are dispatched on directly, skipping the repeated
+ * whitespace check and switch in `json_decode` for the common homogeneous
+ * containers (`list[int]`, `set[str]`, ...) */
+static MS_INLINE PyObject *
+json_decode_item(
+    JSONDecoderState *self, TypeNode *type, PathNode *path, unsigned char c
+) {
+    if (MS_LIKELY(type->types != 0 && !(type->types & (MS_TYPE_CUSTOM | MS_TYPE_CUSTOM_GENERIC)))) {
+        if (c == '"') return json_decode_string(self, type, path);
+        if (is_digit(c) || c == '-') return json_maybe_decode_number(self, type, path);
+    }
+    return json_decode(self, type, path);
+}
+
 static PyObject *
 json_decode_list(JSONDecoderState *self, TypeNode *type, TypeNode *el_type, PathNode *path) {
     unsigned char c;
@@ -17323,7 +18160,7 @@ json_decode_list(JSONDecoderState *self, TypeNode *type, TypeNode *el_type, Path
         }
 
         /* Parse item */
-        PyObject *item = json_decode(self, el_type, &el_path);
+        PyObject *item = json_decode_item(self, el_type, &el_path, c);
         if (item == NULL) goto error;
         el_path.index++;
 
@@ -17395,7 +18232,7 @@ json_decode_set(
         }
 
         /* Parse item */
-        item = json_decode(self, el_type, &el_path);
+        item = json_decode_item(self, el_type, &el_path, c);
         if (item == NULL) goto error;
         el_path.index++;
 
@@ -17445,6 +18282,7 @@ json_decode_fixtuple(JSONDecoderState *self, TypeNode *type, PathNode *path) {
     bool first = true;
     PathNode el_path = {path, 0, NULL};
     Py_ssize_t i = 0, offset, fixtuple_size;
+    bool should_untrack = true;
 
     TypeNode_get_fixtuple(type, &offset, &fixtuple_size);
 
@@ -17495,8 +18333,12 @@ json_decode_fixtuple(JSONDecoderState *self, TypeNode *type, PathNode *path) {
         /* Add item to tuple */
         PyTuple_SET_ITEM(out, i, item);
         i++;
+        if (should_untrack) {
+            should_untrack = !MS_MAYBE_TRACKED(item);
+        }
     }
     Py_LeaveRecursiveCall();
+    if (should_untrack) PyObject_GC_UnTrack(out);
     return out;
 
 size_error:
@@ -17685,12 +18527,9 @@ json_decode_struct_array_inner(
     }
 
     /* Check for missing required fields */
-    if (i < nrequired) {
-        ms_raise_validation_error(
-            path,
-            "Expected `array` of at least length %zd, got %zd%U",
-            nrequired + starting_index,
-            i + starting_index
+    if (MS_UNLIKELY(i < nrequired)) {
+        ms_error_array_too_short(
+            nrequired + starting_index, i + starting_index, path
         );
         goto error;
     }
@@ -17753,6 +18592,22 @@ json_decode_cint(JSONDecoderState *self, int64_t *out, uint64_t *uout, PathNode
          * a measurable performance boost. */
         size_t remaining = self->input_end - self->input_pos;
         size_t n_safe = Py_MIN(19, remaining);
+        if (n_safe >= 8) {
+            const unsigned char *p = self->input_pos;
+            self->input_pos = (unsigned char *)parse_8_digit_runs(
+                p, p + (n_safe & ~(size_t)7), &mantissa
+            );
+            n_safe -= self->input_pos - p;
+        }
+        if (n_safe && self->input_end - self->input_pos >= 8) {
+            /* Consume any shorter run of digits (most int tags) at once */
+            const unsigned char *p = self->input_pos;
+            self->input_pos = (unsigned char *)parse_1_to_8_digits(
+                p, Py_MIN(n_safe, 8), &mantissa
+            );
+            n_safe -= self->input_pos - p;
+        }
+        c = json_peek_or_null(self);
         while (n_safe) {
             c = *self->input_pos;
             if (!is_digit(c)) goto end_integer;
@@ -17867,7 +18722,7 @@ json_ensure_tag_matches(
         const char *expected_str = unicode_str_and_size_nocheck(
             expected_tag, &expected_size
         );
-        if (tag_size != expected_size || memcmp(tag, expected_str, expected_size) != 0) {
+        if (tag_size != expected_size || !ms_memeq(tag, expected_str, expected_size)) {
             /* Tag doesn't match the expected value, error nicely */
             ms_invalid_cstr_value(tag, tag_size, path);
             return -1;
@@ -18438,7 +19293,7 @@ json_decode_struct_union(
 
         /* Check if key matches tag_field */
         bool tag_found = false;
-        if (key_size == tag_field_size && memcmp(key, tag_field, key_size) == 0) {
+        if (key_size == tag_field_size && ms_memeq(key, tag_field, key_size)) {
             tag_found = true;
         }
 
@@ -19143,10 +19998,11 @@ JSONDecoder_decode_lines(JSONDecoder *self, PyObject *const *args, Py_ssize_t na
                     goto done;
                 }
                 unsigned char c = *state.input_pos;
-                if (MS_LIKELY(c != ' ' && c != '\n' && c != '\r' && c != '\t')) {
+                if (MS_LIKELY(!json_is_ws(c))) {
                     break;
                 }
                 state.input_pos++;
+                state.input_pos = json_skip_ws_run(state.input_pos, state.input_end);
             }
 
             /* Read and append next item */
@@ -19299,6 +20155,7 @@ msgspec_json_decode(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyO
      * everything else on the heap */
     TypeNode typenode_any = {MS_TYPE_ANY};
     TypeNodeSimple typenode_struct;
+    PyObject *type_info = NULL;
     if (type == NULL || type == mod->typing_any) {
         state.type = &typenode_any;
     }
@@ -19311,8 +20168,9 @@ msgspec_json_decode(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyO
         state.type = (TypeNode *)(&typenode_struct);
     }
     else {
-        state.type = TypeNode_Convert(type);
-        if (state.type == NULL) return NULL;
+        type_info = TypeNodeInfo_Convert(type);
+        if (type_info == NULL) return NULL;
+        state.type = ((TypeNodeInfo *)type_info)->type;
     }
 
     Py_buffer buffer;
@@ -19338,7 +20196,7 @@ msgspec_json_decode(PyObject *self, PyObject *const *args, Py_ssize_t nargs, PyO
         Py_DECREF(typenode_struct.details[0].pointer);
     }
     else if (state.type != &typenode_any) {
-        TypeNode_Free(state.type);
+        Py_DECREF(type_info);
     }
 
     return res;
@@ -20623,6 +21481,7 @@ convert_seq_to_fixtuple(
         return NULL; /* cpylint-ignore */
     }
 
+    bool should_untrack = true;
     for (Py_ssize_t i = 0; i < fixtuple_size; i++) {
         PathNode item_path = {path, i};
         PyObject *val = convert(
@@ -20633,8 +21492,12 @@ convert_seq_to_fixtuple(
             break;
         }
         PyTuple_SET_ITEM(out, i, val);
+        if (should_untrack) {
+            should_untrack = !MS_MAYBE_TRACKED(val);
+        }
     }
     Py_LeaveRecursiveCall();
+    if (out != NULL && should_untrack) PyObject_GC_UnTrack(out);
     return out;
 }
 
@@ -20774,14 +21637,8 @@ convert_seq_to_struct_array_inner(
     Py_ssize_t nrequired = tagged + nfields - st_type->n_trailing_defaults;
     Py_ssize_t npos = nfields - ndefaults;
 
-    if (size < nrequired) {
-        ms_raise_validation_error(
-            path,
-            "Expected `array` of at least length %zd, got %zd%U",
-            nrequired,
-            size
-        );
-        return NULL;
+    if (MS_UNLIKELY(size < nrequired)) {
+        return ms_error_array_too_short(nrequired, size, path);
     }
 
     if (tagged) {
@@ -21759,10 +22616,10 @@ msgspec_convert(PyObject *self, PyObject *args, PyObject *kwargs)
         return out;
     }
 
-    TypeNode *type = TypeNode_Convert(pytype);
-    if (type == NULL) return NULL;
-    PyObject *out = convert(&state, obj, type, NULL);
-    TypeNode_Free(type);
+    PyObject *type_info = TypeNodeInfo_Convert(pytype);
+    if (type_info == NULL) return NULL;
+    PyObject *out = convert(&state, obj, ((TypeNodeInfo *)type_info)->type, NULL);
+    Py_DECREF(type_info);
     return out;
 }
 
@@ -21836,6 +22693,7 @@ msgspec_clear(PyObject *m)
     Py_CLEAR(st->str___msgspec_cached_hash__);
     Py_CLEAR(st->str__value2member_map_);
     Py_CLEAR(st->str___msgspec_cache__);
+    Py_CLEAR(st->str___msgspec_typenode__);
     Py_CLEAR(st->str__value_);
     Py_CLEAR(st->str__missing_);
     Py_CLEAR(st->str_type);
@@ -22001,6 +22859,8 @@ PyInit__core(void)
         return NULL;
     if (PyType_Ready(&LiteralInfo_Type) < 0)
         return NULL;
+    if (PyType_Ready(&TypeNodeInfo_Type) < 0)
+        return NULL;
     if (PyType_Ready(&TypedDictInfo_Type) < 0)
         return NULL;
     if (PyType_Ready(&DataclassInfo_Type) < 0)
@@ -22231,6 +23091,7 @@ PyInit__core(void)
     CACHED_STRING(str___msgspec_cached_hash__, "__msgspec_cached_hash__");
     CACHED_STRING(str__value2member_map_, "_value2member_map_");
     CACHED_STRING(str___msgspec_cache__, "__msgspec_cache__");
+    CACHED_STRING(str___msgspec_typenode__, "__msgspec_typenode__");
     CACHED_STRING(str__value_, "_value_");
     CACHED_STRING(str__missing_, "_missing_");
     CACHED_STRING(str_type, "type");
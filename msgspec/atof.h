@@ -117,7 +117,7 @@ eisel_lemire(uint64_t man, int32_t exp) {
      * in-depth description of the algorithm */
 
     /* Normalization */
-    const uint64_t* po10 = ms_atof_powers_of_10[exp + 307];
+    const uint64_t* po10 = ms_atof_powers_of_10[exp + 342];
     uint32_t clz = ms_clzll(man);
     man <<= clz;
     uint64_t ret_exp2 = ((uint64_t)(((217706 * exp) >> 16) + 1087)) - ((uint64_t)clz);
@@ -166,6 +166,12 @@ eisel_lemire(uint64_t man, int32_t exp) {
 		ret_exp2++;
 	}
 
+    /* Abort if the result is subnormal or out of range. This is a single
+     * unsigned comparison for `ret_exp2 <= 0 || ret_exp2 >= 0x7FF`. */
+    if (ret_exp2 - 1 >= 0x7FF - 1) {
+        return -1;
+    }
+
     /* Construct final output */
 	ret_mantissa &= 0x000FFFFFFFFFFFFF;
     return ((int64_t)(ret_mantissa | (ret_exp2 << 52)));
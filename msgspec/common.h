@@ -12,12 +12,15 @@
 #ifdef __GNUC__
 #define MS_INLINE __attribute__((always_inline)) inline
 #define MS_NOINLINE __attribute__((noinline))
+#define MS_COLD __attribute__((cold, noinline))
 #elif defined(_MSC_VER)
 #define MS_INLINE __forceinline
 #define MS_NOINLINE __declspec(noinline)
+#define MS_COLD __declspec(noinline)
 #else
 #define MS_INLINE inline
 #define MS_NOINLINE
+#define MS_COLD
 #endif
 
 #endif
@@ -723,6 +723,39 @@ typedef struct floating_decimal_64 {
   int32_t exponent;
 } floating_decimal_64;
 
+// Returns true if the double is an integer in the range [1, 2^53), storing
+// the integer value in v->mantissa. Such values don't need the shortest
+// representation search in d2d, since the integer itself is exact.
+static inline bool d2d_small_int(const uint64_t ieeeMantissa, const uint32_t ieeeExponent,
+  floating_decimal_64* const v) {
+  const uint64_t m2 = (1ull << DOUBLE_MANTISSA_BITS) | ieeeMantissa;
+  const int32_t e2 = (int32_t) ieeeExponent - DOUBLE_BIAS - DOUBLE_MANTISSA_BITS;
+
+  if (e2 > 0) {
+    // f = m2 * 2^e2 >= 2^53 is an integer.
+    // Ignore this case for now.
+    return false;
+  }
+
+  if (e2 < -52) {
+    // f < 1.
+    return false;
+  }
+
+  // Since 2^52 <= m2 < 2^53 and 0 <= -e2 <= 52: 1 <= f = m2 / 2^-e2 < 2^53.
+  // Test if the lower -e2 bits of the significand are 0, i.e. whether the fraction is 0.
+  const uint64_t mask = (1ull << -e2) - 1;
+  const uint64_t fraction = m2 & mask;
+  if (fraction != 0) {
+    return false;
+  }
+
+  // f is an integer in the range [1, 2^53).
+  v->mantissa = m2 >> -e2;
+  v->exponent = 0;
+  return true;
+}
+
 static inline floating_decimal_64 d2d(const uint64_t ieeeMantissa, const uint32_t ieeeExponent) {
   int32_t e2;
   uint64_t m2;
@@ -954,7 +987,15 @@ write_f64(double f, char* buf, bool allow_nonfinite) {
         return sign + 3;
     }
 
-    floating_decimal_64 v = d2d(ieee_mantissa, ieee_exponent);
+    floating_decimal_64 v;
+    if (d2d_small_int(ieee_mantissa, ieee_exponent, &v)) {
+        /* Integers below 2**53 have at most 16 digits, and are always
+         * written as XYZ.0 */
+        char *end = write_u64(v.mantissa, buf);
+        memcpy(end, ".0", 2);
+        return sign + (int)(end - buf) + 2;
+    }
+    v = d2d(ieee_mantissa, ieee_exponent);
 
     int length = write_u64(v.mantissa, buf) - buf;
     int32_t k = v.exponent;
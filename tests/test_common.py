@@ -6,6 +6,7 @@ import datetime
 import decimal
 import enum
 import gc
+import random
 import sys
 import typing
 import uuid
@@ -849,6 +850,16 @@ class TestLiterals:
         with pytest.raises(TypeError, match="not supported"):
             msgspec.msgpack.Decoder(typ)
 
+    @pytest.mark.parametrize("n", [1, 2, 3, 7, 16, 32, 33, 100])
+    def test_str_literal_many_values(self, proto, n):
+        values = tuple(f"value-{i}" for i in range(n))
+        dec = proto.Decoder(Literal[values])
+        for val in values:
+            assert dec.decode(proto.encode(val)) == val
+        for bad in ["", "value-", f"value-{n}", "other"]:
+            with pytest.raises(ValidationError, match="Invalid enum value"):
+                dec.decode(proto.encode(bad))
+
     def test_decode_literal_int_str_and_none_uncached_and_cached(self):
         values = (45987, "an_unlikely_string", None)
         literal = Literal[values]
@@ -1836,6 +1847,47 @@ class TestStructForbidUnknownFields:
             proto.decode(bad, type=Test)
 
 
+class TestStructFieldLookup:
+    @staticmethod
+    def field_names(nfields):
+        """Field names that mostly share a size and first byte, plus some
+        longer than 255 bytes"""
+        names = [f"f{i:02d}" for i in range(nfields)]
+        for i in range(0, nfields, 7):
+            names[i] = "x" * (250 + i) + str(i)
+        return names
+
+    @pytest.mark.parametrize("nfields", [1, 2, 15, 16, 17, 40])
+    def test_decode_struct_fields_any_order(self, proto, nfields):
+        names = self.field_names(nfields)
+        Test = msgspec.defstruct(
+            "Test", [(n, int) for n in names], forbid_unknown_fields=True
+        )
+        sol = Test(*range(nfields))
+        dec = proto.Decoder(Test)
+
+        rng = random.Random(nfields)
+        orders = [names, names[::-1]]
+        orders.extend(rng.sample(names, nfields) for _ in range(8))
+        for order in orders:
+            msg = {n: names.index(n) for n in order}
+            assert dec.decode(proto.encode(msg)) == sol
+            assert msgspec.convert(msg, Test) == sol
+
+    @pytest.mark.parametrize("nfields", [1, 16, 17, 40])
+    def test_decode_struct_unknown_fields_near_misses(self, proto, nfields):
+        names = self.field_names(nfields)
+        Test = msgspec.defstruct(
+            "Test", [(n, int) for n in names], forbid_unknown_fields=True
+        )
+        dec = proto.Decoder(Test)
+
+        for key in ["", "f", "f0", "f000", "g00", f"f{nfields:02d}", "x" * 250 + "x"]:
+            msg = proto.encode({names[0]: 0, key: 1})
+            with pytest.raises(ValidationError, match="unknown field"):
+                dec.decode(msg)
+
+
 class PointUpper(Struct, rename="upper"):
     x: int
     y: int
@@ -3728,6 +3780,20 @@ class TestUUID:
         with pytest.raises(ValidationError, match="Invalid UUID"):
             proto.decode(msg, type=uuid.UUID)
 
+    def test_decode_uuid_non_hex_characters(self, proto):
+        dec = proto.Decoder(uuid.UUID)
+        valid = "12345678123412341234123456789abc"
+        hexdigits = set("0123456789abcdefABCDEF")
+        for c in map(chr, range(128)):
+            if c in hexdigits:
+                continue
+            for i in [0, 1]:
+                msg = proto.encode(
+                    c + valid[1:] if i == 0 else valid[0] + c + valid[2:]
+                )
+                with pytest.raises(ValidationError, match="Invalid UUID"):
+                    dec.decode(msg)
+
 
 class TestNewType:
     def test_decode_newtype(self, proto):
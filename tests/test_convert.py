@@ -5,6 +5,7 @@ import gc
 import math
 import sys
 import uuid
+import weakref
 from base64 import b64encode
 from collections.abc import MutableMapping
 from dataclasses import dataclass, field
@@ -250,6 +251,38 @@ class TestConvert:
         assert sys.getrefcount(res) == 2  # res + 1
         assert sys.getrefcount(x) == 2  # x + 1
 
+    def test_dec_hook_reentrant(self):
+        class Custom:
+            def __init__(self, x):
+                self.x = x
+
+        typ = Tuple[int, Custom]
+
+        def dec_hook(type, obj):
+            if obj == "outer":
+                # Convert again with the same type while it's in use
+                obj = convert([2, "inner"], typ, dec_hook=dec_hook)
+            return type(obj)
+
+        res = convert([1, "outer"], typ, dec_hook=dec_hook)
+        assert res[0] == 1
+        inner = res[1].x
+        assert inner[0] == 2
+        assert inner[1].x == "inner"
+
+    def test_type_not_kept_alive(self):
+        @dataclass
+        class Ex:
+            x: int
+
+        assert convert({"x": 1}, Ex) == Ex(1)
+        assert convert([{"x": 1}], list[Ex]) == [Ex(1)]
+
+        ref = weakref.ref(Ex)
+        del Ex
+        gc.collect()
+        assert ref() is None
+
     def test_unsupported_output_type(self):
         with pytest.raises(TypeError, match="more than one array-like"):
             convert({}, Union[List[int], Tuple[str, ...]])
@@ -1025,6 +1058,16 @@ class TestSequences:
         with pytest.raises(ValidationError, match="Expected `array` of length 3"):
             convert((1, "two"), typ)
 
+    def test_fixtuple_gc_maybe_untracked(self):
+        msg = [[1, "two"], [None, 1.5], [[], 1], [1, {}]]
+        a, b, c, d = convert(msg, List[Tuple[Any, Any]])
+        assert not gc.is_tracked(a)
+        assert not gc.is_tracked(b)
+        assert gc.is_tracked(c)
+        assert gc.is_tracked(d)
+        res = convert([[1, "two"], 3.0], Tuple[Tuple[int, str], float])
+        assert not gc.is_tracked(res)
+
 
 class TestNamedTuple:
     def test_namedtuple_no_defaults(self):
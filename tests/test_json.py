@@ -8,9 +8,11 @@ import gc
 import itertools
 import json
 import math
+import re
 import string
 import sys
 import uuid
+import weakref
 from dataclasses import dataclass
 from decimal import Decimal
 from typing import (
@@ -34,6 +36,15 @@ import msgspec
 
 UTC = datetime.timezone.utc
 
+# Common DecodeError messages, compiled once for use with `pytest.raises`
+TRUNCATED = re.compile("truncated")
+INVALID_CHARACTER = re.compile("invalid character")
+
+# Shared encoder & untyped decoder, for tests that don't exercise the
+# module-level functions themselves
+ENC = msgspec.json.Encoder()
+DEC_ANY = msgspec.json.Decoder()
+
 
 class FruitInt(enum.IntEnum):
     APPLE = -1
@@ -73,24 +84,34 @@ class Custom:
         return self.x == other.x and self.y == other.y
 
 
+def _invalid_unions():
+    literal = Literal["a", "b"]
+    types = [
+        FruitStr,
+        literal,
+        str,
+        datetime.datetime,
+        datetime.date,
+        bytes,
+        bytearray,
+    ]
+    return [
+        Union[combo]
+        for length in [2, 3, 4]
+        for combo in itertools.combinations(types, length)
+        if set(combo) not in ({bytes, bytearray}, {str, literal})
+    ]
+
+
+# Unions of types that all encode as JSON strings
+INVALID_UNIONS = _invalid_unions()
+
+
 class TestInvalidJSONTypes:
-    def test_invalid_type_union(self):
-        literal = Literal["a", "b"]
-        types = [
-            FruitStr,
-            literal,
-            str,
-            datetime.datetime,
-            datetime.date,
-            bytes,
-            bytearray,
-        ]
-        for length in [2, 3, 4]:
-            for types in itertools.combinations(types, length):
-                if set(types) in ({bytes, bytearray}, {str, literal}):
-                    continue
-                with pytest.raises(TypeError, match="not supported"):
-                    msgspec.json.Decoder(Union[types])
+    @pytest.mark.parametrize("typ", INVALID_UNIONS)
+    def test_invalid_type_union(self, typ):
+        with pytest.raises(TypeError, match="not supported"):
+            msgspec.json.Decoder(typ)
 
     def test_invalid_dict_key_type_errors_at_runtime(self):
         # We used to check this statically at TypeNode build time, but this was
@@ -133,7 +154,7 @@ class TestEncodeFunction:
         orig_refcount = sys.getrefcount(enc_hook)
 
         res = msgspec.json.encode(unsupported, enc_hook=enc_hook)
-        assert msgspec.json.encode("hello") == res
+        assert res == b'"hello"'
         assert sys.getrefcount(enc_hook) == orig_refcount
 
     def test_encode_enc_hook_errors(self):
@@ -223,7 +244,7 @@ class TestEncoderMisc:
         assert sys.getrefcount(enc_hook) == orig_refcount + 1
 
         res = enc.encode(unsupported)
-        assert enc.encode("hello") == res
+        assert res == b'"hello"'
 
         del enc
         assert sys.getrefcount(enc_hook) == orig_refcount
@@ -248,8 +269,7 @@ class TestEncoderMisc:
         enc = msgspec.json.Encoder(enc_hook=enc_hook)
 
         msg = enc.encode(Node(Node(1)))
-        res = json.loads(msg)
-        assert res == {"type": "Node", "a": {"type": "Node", "a": 1}}
+        assert msg == b'{"type":"Node","a":{"type":"Node","a":1}}'
 
     def test_encode_enc_hook_recursion_error(self):
         enc = msgspec.json.Encoder(enc_hook=lambda x: x)
@@ -271,40 +291,37 @@ class TestEncoderMisc:
 
     @pytest.mark.parametrize("buf_size", [0, 1, 16, 55, 60])
     def test_encode_into(self, buf_size):
-        enc = msgspec.json.Encoder()
-
         msg = {"key": "x" * 48}
-        encoded = msgspec.json.encode(msg)
+        encoded = b'{"key":"' + b"x" * 48 + b'"}'
 
         buf = bytearray(buf_size)
-        out = enc.encode_into(msg, buf)
+        out = ENC.encode_into(msg, buf)
         assert out is None
         assert buf == encoded
 
     def test_encode_into_offset(self):
-        enc = msgspec.json.Encoder()
         msg = {"key": "value"}
-        encoded = enc.encode(msg)
+        encoded = b'{"key":"value"}'
 
         # Offset 0 is default
         buf = bytearray()
-        enc.encode_into(msg, buf, 0)
+        ENC.encode_into(msg, buf, 0)
         assert buf == encoded
 
         # Offset in bounds uses the provided offset
         buf = bytearray(b"01234")
-        enc.encode_into(msg, buf, 2)
+        ENC.encode_into(msg, buf, 2)
         assert buf == b"01" + encoded
 
         # Offset out of bounds extends
         buf = bytearray(b"01234")
-        enc.encode_into(msg, buf, 10)
+        ENC.encode_into(msg, buf, 10)
         assert buf[:5] == b"01234"
         assert buf[10:] == encoded
 
         # Offset -1 means append at end
         buf = bytearray(b"01234")
-        enc.encode_into(msg, buf, -1)
+        ENC.encode_into(msg, buf, -1)
         assert buf == b"01234" + encoded
 
     def test_encode_into_handles_errors_properly(self):
@@ -383,7 +400,7 @@ class TestDecodeFunction:
     def test_decode_from_str(self):
         assert msgspec.json.decode("[1, 2, 3]") == [1, 2, 3]
 
-        with pytest.raises(msgspec.DecodeError, match="truncated"):
+        with pytest.raises(msgspec.DecodeError, match=TRUNCATED):
             assert msgspec.json.decode("[1, 2, 3")
 
     def test_decode_type_keyword(self):
@@ -406,6 +423,57 @@ class TestDecodeFunction:
         for _ in range(2):
             assert msgspec.json.decode(msg, type=Point) == Point(1, 2)
 
+    def test_decode_type_many_types(self):
+        # Each alias caches its own converted type
+        types = [Tuple[(int,) * n] for n in range(1, 150)]
+        for _ in range(2):
+            for n, typ in enumerate(types, 1):
+                msg = msgspec.json.encode(list(range(n)))
+                assert msgspec.json.decode(msg, type=typ) == tuple(range(n))
+                with pytest.raises(msgspec.ValidationError):
+                    msgspec.json.decode(b"[]", type=typ)
+
+    @pytest.mark.parametrize("kind", ["dataclass", "typeddict", "generic"])
+    def test_decode_type_doesnt_keep_type_alive(self, kind):
+        if kind == "typeddict":
+
+            class Ex(TypedDict):
+                x: int
+
+        else:
+
+            @dataclass
+            class Ex:
+                x: int
+
+        typ = list[Ex] if kind == "generic" else Ex
+        msg = b'[{"x": 1}]' if kind == "generic" else b'{"x": 1}'
+        msgspec.json.decode(msg, type=typ)
+
+        ref = weakref.ref(Ex)
+        del Ex, typ
+        gc.collect()
+        assert ref() is None
+
+    def test_decode_type_reentrant(self):
+        class Custom:
+            def __init__(self, x):
+                self.x = x
+
+        typ = Tuple[int, Custom]
+
+        def dec_hook(type, obj):
+            if obj == "outer":
+                # Decode again with the same type while it's in use
+                obj = msgspec.json.decode(b'[2, "inner"]', type=typ, dec_hook=dec_hook)
+            return type(obj)
+
+        res = msgspec.json.decode(b'[1, "outer"]', type=typ, dec_hook=dec_hook)
+        assert res[0] == 1
+        inner = res[1].x
+        assert inner[0] == 2
+        assert inner[1].x == "inner"
+
     def test_decode_type_struct_invalid_type(self):
         class Test(msgspec.Struct):
             x: 1
@@ -439,6 +507,25 @@ class TestDecodeFunction:
         with pytest.raises(TypeError, match="Extra keyword arguments"):
             msgspec.json.decode(buf, type=List[int], extra=1)
 
+    @pytest.mark.parametrize("n", [2, 15, 16, 17, 31, 32, 33, 100])
+    def test_decode_long_whitespace_runs(self, n):
+        ws = ("\t\n\r " * n)[:n]
+        parts = ["[", "1", ",", '{"a"', ":", "2", "}", "]"]
+        msg = (ws + ws.join(parts) + ws).encode()
+        assert msgspec.json.decode(msg) == [1, {"a": 2}]
+
+        with pytest.raises(msgspec.DecodeError, match=TRUNCATED):
+            msgspec.json.decode((ws + "[" + ws).encode())
+
+        with pytest.raises(msgspec.DecodeError, match=INVALID_CHARACTER):
+            msgspec.json.decode((ws + "[" + ws + "x").encode())
+
+        with pytest.raises(msgspec.DecodeError, match="trailing characters"):
+            msgspec.json.decode(("[]" + ws + "!" + ws).encode())
+
+        lines = (ws + "1" + ws + "\n" + ws + "[2]" + ws).encode()
+        assert DEC_ANY.decode_lines(lines) == [1, [2]]
+
     def test_decode_with_trailing_characters_errors(self):
         with pytest.raises(msgspec.DecodeError):
             msgspec.json.decode(b'[1, 2, 3]"trailing"')
@@ -449,7 +536,7 @@ class TestDecoderMisc:
         dec = msgspec.json.Decoder()
         assert dec.decode("[1, 2, 3]") == [1, 2, 3]
 
-        with pytest.raises(msgspec.DecodeError, match="truncated"):
+        with pytest.raises(msgspec.DecodeError, match=TRUNCATED):
             assert dec.decode("[1, 2, 3")
 
     def test_decoder_type_attribute(self):
@@ -478,13 +565,12 @@ class TestDecoderMisc:
         ["", "\n", "1", "  1", "1\t\r\n", "1\n\r\t 2", "1\n2\n", "1\n2\n3\n"],
     )
     def test_decode_lines(self, msg):
-        dec = msgspec.json.Decoder()
         sol = []
         for part in msg.splitlines():
             if part := part.strip():
-                sol.append(dec.decode(part))
+                sol.append(DEC_ANY.decode(part))
 
-        res = dec.decode_lines(msg)
+        res = DEC_ANY.decode_lines(msg)
         assert res == sol
 
     def test_decode_lines_typed(self):
@@ -492,7 +578,7 @@ class TestDecoderMisc:
             x: int
 
         sol = [Ex(1), Ex(2)]
-        buf = msgspec.json.Encoder().encode_lines(sol)
+        buf = ENC.encode_lines(sol)
         res = msgspec.json.Decoder(Ex).decode_lines(buf)
         assert res == sol
 
@@ -590,7 +676,7 @@ class TestBoolAndNone:
 
 
 class TestStrings:
-    STRINGS = [
+    STRINGS = (
         ("", b'""'),
         ("a", b'"a"'),
         (" a b c d", b'" a b c d"'),
@@ -606,11 +692,20 @@ class TestStrings:
         ("123 \x01\x02\x03 456", b'"123 \\u0001\\u0002\\u0003 456"'),
         ("\x01\x02\x03 456", b'"\\u0001\\u0002\\u0003 456"'),
         ("123 \x01\x02\x03", b'"123 \\u0001\\u0002\\u0003"'),
-    ]
+    )
+
+    def test_encode_str(self):
+        for decoded, encoded in self.STRINGS:
+            assert ENC.encode(decoded) == encoded
 
-    @pytest.mark.parametrize("decoded, encoded", STRINGS)
-    def test_encode_str(self, decoded, encoded):
-        assert msgspec.json.encode(decoded) == encoded
+    @pytest.mark.parametrize("length", [8, 16, 17, 40])
+    def test_encode_str_every_ascii_char_at_every_position(self, length):
+        chars = [chr(i) for i in range(0x80)] + ["\x80", "\xe9", "\U0001f600"]
+        for i in range(length):
+            for c in chars:
+                s = "x" * i + c + "y" * (length - i - 1)
+                expected = json.dumps(s, ensure_ascii=False).encode()
+                assert msgspec.json.encode(s) == expected
 
     @pytest.mark.parametrize("length", [*range(1, 17), 25, 33, 63, 255])
     @pytest.mark.parametrize("esc1", ["\n", "\x01"])
@@ -646,9 +741,14 @@ class TestStrings:
             res = msgspec.json.encode(s)
             assert res == sol
 
-    @pytest.mark.parametrize("decoded, encoded", STRINGS)
-    def test_decode_str(self, decoded, encoded):
-        assert msgspec.json.decode(encoded) == decoded
+    def test_decode_str(self):
+        for decoded, encoded in self.STRINGS:
+            assert DEC_ANY.decode(encoded) == decoded
+
+    def test_decode_one_char_str_is_singleton(self):
+        a, b, c = msgspec.json.decode(b'["a", "a", "\\u0061"]', type=List[str])
+        assert a == "a"
+        assert a is b is c
 
     @pytest.mark.parametrize(
         "decoded, encoded",
@@ -684,66 +784,92 @@ class TestStrings:
             msgspec.json.decode(s)
 
     def test_decode_str_invalid_byte(self):
-        with pytest.raises(msgspec.DecodeError, match="invalid character"):
+        with pytest.raises(msgspec.DecodeError, match=INVALID_CHARACTER):
             msgspec.json.decode(b'"123 \x00 456"')
 
-        with pytest.raises(msgspec.DecodeError, match="invalid character"):
+        with pytest.raises(msgspec.DecodeError, match=INVALID_CHARACTER):
             msgspec.json.decode(b'"123 \x01 456"')
 
+    @pytest.mark.parametrize("char", ['"', "\\", "\n", "é", "𝄞"])
+    def test_decode_str_special_char_positions(self, char):
+        """Check every position of a special character within the bulk
+        scanned blocks of a string"""
+
+        class Test(msgspec.Struct):
+            x: int
+
+        for i in range(40):
+            sol = "x" * i + char + "y" * (40 - i)
+            buf = msgspec.json.encode(sol)
+            assert msgspec.json.decode(buf) == sol
+            assert msgspec.json.decode(b"{" + buf + b": 1}") == {sol: 1}
+            # Test str skipping
+            msg = b'{"y": ' + buf + b', "x": 1}'
+            assert msgspec.json.decode(msg, type=Test) == Test(1)
+
+    def test_decode_str_invalid_char_positions(self):
+        for i in range(40):
+            buf = b'"' + b"x" * i + b"\x1f" + b"y" * (40 - i) + b'"'
+            with pytest.raises(msgspec.DecodeError, match=INVALID_CHARACTER):
+                msgspec.json.decode(buf)
+            with pytest.raises(msgspec.DecodeError, match=INVALID_CHARACTER):
+                msgspec.json.decode(b'["\xc3\xa9' + buf[1:] + b"]")
+
     def test_decode_str_missing_closing_quote(self):
-        with pytest.raises(msgspec.DecodeError, match="truncated"):
+        with pytest.raises(msgspec.DecodeError, match=TRUNCATED):
             msgspec.json.decode(b'"test')
 
-    @pytest.mark.parametrize("length", range(10))
-    @pytest.mark.parametrize("in_list", [False, True])
     @pytest.mark.parametrize("unicode", [False, True])
     @pytest.mark.parametrize("escape", [False, True])
-    def test_decode_str_lengths(self, length, in_list, unicode, escape):
+    def test_decode_str_lengths(self, unicode, escape):
         """A test designed to get full coverage of the unrolled loops in the
-        string parsing routine"""
+        string parsing routine. Each message is decoded on its own, since the
+        loops' tails depend on how close the string ends to the end of input"""
+
+        class Test(msgspec.Struct):
+            x: int
+
+        dec = msgspec.json.Decoder(Test)
+
         if unicode:
             prefix = "𝄞\nÁ\t\n𝄞Á" if escape else "𝄞Á"
         else:
             prefix = "a\nb\t\ncd" if escape else ""
-        s = prefix + string.ascii_letters[:length]
-        sol = [s, 1] if in_list else s
-        buf = msgspec.json.encode(sol)
-        res = msgspec.json.decode(buf)
-        assert res == sol
+        for length in [*range(10), 15, 16, 17, 31, 32, 33, 52]:
+            s = prefix + string.ascii_letters[:length]
+            for sol in [s, [s, 1]]:
+                buf = ENC.encode(sol)
+                res = DEC_ANY.decode(buf)
+                assert res == sol
 
-        left, _, right = buf.rpartition(b'"')
-        buf2 = left + b'\x01"' + right
-        with pytest.raises(msgspec.DecodeError, match="invalid character"):
-            msgspec.json.decode(buf2)
+                left, _, right = buf.rpartition(b'"')
+                buf2 = left + b'\x01"' + right
+                with pytest.raises(msgspec.DecodeError, match=INVALID_CHARACTER):
+                    DEC_ANY.decode(buf2)
 
-        # Test str skipping
-        class Test(msgspec.Struct):
-            x: int
-
-        buf3 = msgspec.json.encode({"y": sol, "x": 1})
-        msgspec.json.decode(buf3, type=Test)
+                # Test str skipping
+                buf3 = ENC.encode({"y": sol, "x": 1})
+                assert dec.decode(buf3).x == 1
 
 
 class TestBinary:
-    @pytest.mark.parametrize(
-        "x", [b"", b"a", b"ab", b"abc", b"abcd", b"abcde", b"abcdef", b"\x00\xff"]
+    BINARY = tuple(
+        (x, b'"' + base64.b64encode(x) + b'"')
+        for x in [b"", b"a", b"ab", b"abc", b"abcd", b"abcde", b"abcdef", b"\x00\xff"]
     )
+
     @pytest.mark.parametrize("type", [bytes, bytearray, memoryview])
-    def test_encode_binary(self, x, type):
-        x = type(x)
-        s = msgspec.json.encode(x)
-        expected = b'"' + base64.b64encode(x) + b'"'
-        assert s == expected
+    def test_encode_binary(self, type):
+        for x, expected in self.BINARY:
+            assert msgspec.json.encode(type(x)) == expected
 
-    @pytest.mark.parametrize(
-        "x", [b"", b"a", b"ab", b"abc", b"abcd", b"abcde", b"abcdef", b"\x00\xff"]
-    )
     @pytest.mark.parametrize("type", [bytes, bytearray, memoryview])
-    def test_decode_binary(self, x, type):
-        s = b'"' + base64.b64encode(x) + b'"'
-        res = msgspec.json.decode(s, type=type)
-        assert res == bytes(x)
-        assert isinstance(res, type)
+    def test_decode_binary(self, type):
+        dec = msgspec.json.Decoder(type)
+        for x, s in self.BINARY:
+            res = dec.decode(s)
+            assert res == x
+            assert isinstance(res, type)
 
     @pytest.mark.parametrize("n", [1023, 1024, 1025])
     def test_roundtrip_random(self, n, rand):
@@ -882,15 +1008,15 @@ class TestDatetime:
             "2000-03-01T12:01:01",
         ],
     )
-    @pytest.mark.parametrize("sign", ["-", "+"])
-    @pytest.mark.parametrize("hour", [0, 8, 12, 16, 23])
-    @pytest.mark.parametrize("minute", [0, 30])
-    def test_decode_datetime_with_timezone(self, dt, sign, hour, minute):
-        s = f"{dt}{sign}{hour:02}:{minute:02}"
-        json_s = f'"{s}"'.encode("utf-8")
-        exp = datetime.datetime.fromisoformat(s)
-        res = msgspec.json.decode(json_s, type=datetime.datetime)
-        assert res == exp
+    def test_decode_datetime_with_timezone(self, dt):
+        for sign, hour, minute in itertools.product(
+            ["-", "+"], [0, 8, 12, 16, 23], [0, 30]
+        ):
+            s = f"{dt}{sign}{hour:02}:{minute:02}"
+            json_s = f'"{s}"'.encode("utf-8")
+            exp = datetime.datetime.fromisoformat(s)
+            res = msgspec.json.decode(json_s, type=datetime.datetime)
+            assert res == exp
 
     def test_decode_timezone_cache(self):
         msg = b'"2000-01-01T00:00:01+03:02"'
@@ -982,6 +1108,23 @@ class TestDatetime:
         res = msgspec.json.decode(msg, type=datetime.datetime)
         assert res == sol
 
+    @pytest.mark.parametrize("suffix", ["", "Z", "+01:00"])
+    def test_decode_fractional_seconds_every_length(self, suffix):
+        tz = {
+            "": None,
+            "Z": UTC,
+            "+01:00": datetime.timezone(datetime.timedelta(hours=1)),
+        }[suffix]
+        digits = "123456789012"
+        for n in range(1, len(digits) + 1):
+            frac = digits[:n]
+            micros = int(frac[:6].ljust(6, "0")) + (n > 6 and frac[6] >= "5")
+            sol = datetime.datetime(2022, 1, 2, 3, 4, 5, micros, tz)
+            msg = msgspec.json.encode(f"2022-01-02T03:04:05.{frac}{suffix}")
+            assert msgspec.json.decode(msg, type=datetime.datetime) == sol
+            msg = msgspec.json.encode(f"03:04:05.{frac}{suffix}")
+            assert msgspec.json.decode(msg, type=datetime.time) == sol.timetz()
+
     @pytest.mark.parametrize(
         "lax, strict",
         [
@@ -1063,6 +1206,25 @@ class TestDatetime:
         with pytest.raises(msgspec.ValidationError, match="Invalid RFC3339"):
             msgspec.json.decode(s, type=datetime.datetime)
 
+    @pytest.mark.parametrize(
+        "typ, s",
+        [
+            (datetime.datetime, "2023-05-17T12:34:56"),
+            (datetime.date, "2023-05-17"),
+            (datetime.time, "12:34:56"),
+        ],
+    )
+    def test_decode_datetime_invalid_character_at_every_position(self, typ, s):
+        dec = msgspec.json.Decoder(typ)
+        for i, orig in enumerate(s):
+            chars = "/:;-.Za\x7f\xe9" if orig.isdigit() else "/:;-.Za\x7f\xe90"
+            for c in chars:
+                if c == orig:
+                    continue
+                msg = msgspec.json.encode(s[:i] + c + s[i + 1 :])
+                with pytest.raises(msgspec.ValidationError, match="Invalid RFC3339"):
+                    dec.decode(msg)
+
 
 class TestIntegers:
     @pytest.mark.parametrize("ndigits", range(21))
@@ -1079,6 +1241,13 @@ class TestIntegers:
         if 0 < ndigits < 20:
             assert msgspec.json.encode(-x) == b"-" + s
 
+    @pytest.mark.parametrize("exp", range(20))
+    def test_encode_int_digit_count_boundaries(self, exp):
+        for x in [10**exp - 1, 10**exp, 10**exp + 1]:
+            assert msgspec.json.encode(x) == str(x).encode()
+            if x < 2**63:
+                assert msgspec.json.encode(-x) == str(-x).encode()
+
     @pytest.mark.parametrize("x", [-(2**63 + 1), -(2**63), 2**64 - 1, 2**64])
     def test_encode_big_integers(self, x):
         assert msgspec.json.encode(x) == str(x).encode()
@@ -1097,6 +1266,31 @@ class TestIntegers:
         if 0 < ndigits < 20:
             assert msgspec.json.decode(b"-" + s) == -x
 
+    @pytest.mark.parametrize("ndigits", [*range(1, 10), 15, 16, 17, 24])
+    @pytest.mark.parametrize("suffix", [b"", b" ", b"a"])
+    def test_decode_int_digit_runs(self, ndigits, suffix):
+        # Digit runs are parsed 8 at a time, with any shorter run consumed at
+        # once when enough input remains; check the handoff to the scalar
+        # loop at the end of the buffer and before a non-digit.
+        s = "".join(itertools.islice(itertools.cycle("987654321"), ndigits))
+        x = int(s)
+        cases = [
+            (s.encode(), Any, x),
+            (s.encode(), int, x),
+            (b'{"%s":1}' % s.encode(), Dict[int, int], {x: 1}),
+            (b"1." + s.encode(), Any, float("1." + s)),
+        ]
+        for buf, typ, sol in cases:
+            if suffix:
+                buf = b"[" + buf + suffix + b"]"
+                typ = List[typ]
+                sol = [sol]
+            if suffix == b"a":
+                with pytest.raises(msgspec.DecodeError):
+                    msgspec.json.decode(buf, type=typ)
+            else:
+                assert msgspec.json.decode(buf, type=typ) == sol
+
     @pytest.mark.parametrize("x", [2**63 - 1, 2**63, 2**63 + 1])
     def test_decode_int_19_digit_overflow_boundary(self, x):
         s = str(x).encode("utf-8")
@@ -1312,6 +1506,19 @@ class TestFloat:
         x2 = msgspec.json.decode(s)
         assert x == x2
 
+    @pytest.mark.parametrize("n", range(55))
+    def test_encode_float_integral_values(self, n):
+        for i in [2**n - 1, 2**n, 2**n + 1]:
+            x = float(i)
+            s = msgspec.json.encode(x)
+            if 0 < x < 1e16:
+                assert s == b"%d.0" % x
+            assert msgspec.json.decode(s) == x
+            s = msgspec.json.encode(-x)
+            if 0 < x < 1e16:
+                assert s == b"-%d.0" % x
+            assert msgspec.json.decode(s) == -x
+
     @pytest.mark.parametrize("scale", [0.0001, 1, 1000])
     @pytest.mark.parametrize("n", range(54))
     def test_roundtrip_float_powers_of_2(self, n, scale):
@@ -1366,6 +1573,55 @@ class TestFloat:
         x2 = msgspec.json.decode(s, type=float)
         assert x == x2 == float(s)
 
+    @pytest.mark.parametrize("n", [790, 1000])
+    @pytest.mark.parametrize("tail", [b"", b"1"])
+    def test_decode_float_truncated_halfway(self, n, tail):
+        # 2 ** 53 + 1 is halfway between two doubles; any nonzero digit after
+        # a long run of zeros must still round up.
+        s = b"9007199254740993" + b"0" * n + tail + b"e-%d" % (n + len(tail))
+        x = msgspec.json.decode(s)
+        x2 = msgspec.json.decode(b"0." + b"0" * n + s)
+        assert x == float(s)
+        assert x2 == float(b"0." + b"0" * n + s)
+
+    @pytest.mark.parametrize("exp", range(20, 40))
+    def test_decode_float_large_exponent_fast_path_boundaries(self, exp):
+        # Small mantissas with exponents past 22 may be scaled exactly; check
+        # mantissas on either side of the largest one that allows this.
+        limit = (2**53 - 1) // 10 ** max(exp - 22, 0)
+        for m in [0, 1, 12, 99, limit - 1, limit, limit + 1, 2**53 - 1, 2**53]:
+            if m < 0:
+                continue
+            for s in [b"%de%d" % (m, exp), b"-%d.5e%d" % (m, exp)]:
+                assert msgspec.json.decode(s) == float(s)
+                assert msgspec.json.decode(b'{"%s":1}' % s, type=Dict[float, int]) == {
+                    float(s): 1
+                }
+
+    @pytest.mark.parametrize("exp", [*range(-345, -300), *range(285, 312)])
+    def test_decode_float_extreme_exponents(self, exp):
+        # Exponents near the edges of the Eisel-Lemire power table, including
+        # results that are subnormal or out of range.
+        for m in [b"1", b"17976931348623157", b"2225073858507201", b"9" * 19]:
+            for s in [b"%se%d" % (m, exp), b"-0.%se%d" % (m, exp + 19)]:
+                x = float(s)
+                if math.isinf(x):
+                    with pytest.raises(msgspec.ValidationError, match="out of range"):
+                        msgspec.json.decode(s)
+                else:
+                    assert msgspec.json.decode(s) == x
+
+    @pytest.mark.parametrize("exp", [-400, -1, 0, 288, 289, 290, 308, 309, 400])
+    @pytest.mark.parametrize("m", [b"1", b"1.5", b"9" * 19, b"9" * 25])
+    def test_decode_float_invalid_type_errors(self, m, exp):
+        s = b"%se%d" % (m, exp)
+        if math.isinf(float(s)):
+            match = "Number out of range"
+        else:
+            match = "Expected `int`, got `float`"
+        with pytest.raises(msgspec.ValidationError, match=match):
+            msgspec.json.decode(s, type=int)
+
     @pytest.mark.parametrize("prefix", [b"0", b"0.0", b"0.0001", b"123", b"123.000"])
     @pytest.mark.parametrize("e", [b"e", b"E"])
     @pytest.mark.parametrize("sign", [b"+", b"-", b""])
@@ -1634,6 +1890,18 @@ class TestFloat:
         assert res == decimal.Decimal("1.33")
         assert type(res) is decimal.Decimal
 
+    def test_float_hook_decimal_preserves_digits(self):
+        dec = msgspec.json.Decoder(float_hook=decimal.Decimal)
+        res = dec.decode(b"[1.100, -1.5e-3, 12E+2, -0.0, 1]")
+        assert res == [
+            decimal.Decimal("1.100"),
+            decimal.Decimal("-1.5e-3"),
+            decimal.Decimal("12E+2"),
+            decimal.Decimal("-0.0"),
+            1,
+        ]
+        assert [str(x) for x in res[:4]] == ["1.100", "-0.0015", "1.2E+3", "-0.0"]
+
     def test_float_hook_typed(self):
         class Ex(msgspec.Struct):
             a: float
@@ -1665,6 +1933,14 @@ class TestFloat:
         assert "at `$.b`" in str(rec.value)
 
 
+# Number messages for `TestDecimal.test_decimal_from_number_priority`
+POSINT = "123"
+NEGINT = "-123"
+BIGINT = "123456789" * 3
+DOUBLE = "123.45"
+EXTDOUBLE = "123." + ("123456789" * 3)
+
+
 class TestDecimal:
     """Most decimal tests are in test_common.py, the ones here are for json
     specific behaviors"""
@@ -1720,39 +1996,34 @@ class TestDecimal:
         assert type(rec.value) is msgspec.DecodeError
         assert "JSON is malformed" in str(rec.value)
 
-    def test_decimal_from_number_priority(self):
-        posint = "123"
-        negint = "-123"
-        bigint = "123456789" * 3
-        double = "123.45"
-        extdouble = "123." + ("123456789" * 3)
-
-        cases = [
-            (posint, Decimal, Decimal),
-            (negint, Decimal, Decimal),
-            (bigint, Decimal, Decimal),
-            (double, Decimal, Decimal),
-            (extdouble, Decimal, Decimal),
-            (posint, Union[Decimal, int], int),
-            (negint, Union[Decimal, int], int),
-            (bigint, Union[Decimal, int], int),
-            (double, Union[Decimal, int], Decimal),
-            (extdouble, Union[Decimal, int], Decimal),
-            (posint, Union[Decimal, float], float),
-            (negint, Union[Decimal, float], float),
-            (bigint, Union[Decimal, float], float),
-            (double, Union[Decimal, float], float),
-            (extdouble, Union[Decimal, float], float),
-            (posint, Union[Decimal, int, float], int),
-            (negint, Union[Decimal, int, float], int),
-            (bigint, Union[Decimal, int, float], int),
-            (double, Union[Decimal, int, float], float),
-            (extdouble, Union[Decimal, int, float], float),
-        ]
-
-        for msg, request_type, out_type in cases:
-            out = msgspec.json.decode(msg, type=request_type)
-            assert type(out) is out_type
+    @pytest.mark.parametrize(
+        "msg, request_type, out_type",
+        [
+            (POSINT, Decimal, Decimal),
+            (NEGINT, Decimal, Decimal),
+            (BIGINT, Decimal, Decimal),
+            (DOUBLE, Decimal, Decimal),
+            (EXTDOUBLE, Decimal, Decimal),
+            (POSINT, Union[Decimal, int], int),
+            (NEGINT, Union[Decimal, int], int),
+            (BIGINT, Union[Decimal, int], int),
+            (DOUBLE, Union[Decimal, int], Decimal),
+            (EXTDOUBLE, Union[Decimal, int], Decimal),
+            (POSINT, Union[Decimal, float], float),
+            (NEGINT, Union[Decimal, float], float),
+            (BIGINT, Union[Decimal, float], float),
+            (DOUBLE, Union[Decimal, float], float),
+            (EXTDOUBLE, Union[Decimal, float], float),
+            (POSINT, Union[Decimal, int, float], int),
+            (NEGINT, Union[Decimal, int, float], int),
+            (BIGINT, Union[Decimal, int, float], int),
+            (DOUBLE, Union[Decimal, int, float], float),
+            (EXTDOUBLE, Union[Decimal, int, float], float),
+        ],
+    )
+    def test_decimal_from_number_priority(self, msg, request_type, out_type):
+        out = msgspec.json.decode(msg, type=request_type)
+        assert type(out) is out_type
 
 
 class TestSequences:
@@ -1860,6 +2131,16 @@ class TestSequences:
         ):
             dec.decode(b'[1, "two"]')
 
+    def test_decode_fixtuple_gc_maybe_untracked(self):
+        dec = msgspec.json.Decoder(List[Tuple[Any, Any]])
+        a, b, c, d = dec.decode(b'[[1, "two"], [null, 1.5], [[], 1], [1, {}]]')
+        assert not gc.is_tracked(a)
+        assert not gc.is_tracked(b)
+        assert gc.is_tracked(c)
+        assert gc.is_tracked(d)
+        dec = msgspec.json.Decoder(Tuple[Tuple[int, str], float])
+        assert not gc.is_tracked(dec.decode(b'[[1, "two"], 3.0]'))
+
 
 class TestNamedTuple:
     """Most tests are in `test_common`, this just tests some JSON peculiarities"""
@@ -1896,6 +2177,34 @@ class TestNamedTuple:
             msgspec.json.decode(s, type=Test)
 
 
+# Malformed JSON objects, and the errors they raise when decoding any
+# object-like type
+MALFORMED_OBJECTS = [
+    (b"{", "truncated"),
+    (b'{"a"', "truncated"),
+    (b'{"first"', "truncated"),
+    (b"{,}", "object keys must be strings"),
+    (b"{:}", "object keys must be strings"),
+    (b"{1: 2}", "object keys must be strings"),
+    (b'{"a": 1, }', "trailing comma in object"),
+    (b'{"age": 13, }', "trailing comma in object"),
+    (b'{"a": 1, "b" 2}', "expected ':'"),
+    (b'{"age": 13, "first" "harry"}', "expected ':'"),
+    (b'{"a": 1, "b": 2  "c"}', r"expected ',' or '}'"),
+    (b'{"age": 13, "first": "harry"  "c"}', r"expected ',' or '}'"),
+]
+
+
+def _string_cache_msg(key):
+    msg = [{key: 1}, {key: 2}, {key: 3}]
+    return msg, msgspec.json.encode(msg)
+
+
+# Messages for the string cache tests, built once at import
+STRING_CACHE_MSGS = {n: _string_cache_msg("x" * n) for n in [1, 3, 32, 33]}
+NON_ASCII_STRING_CACHE_MSG = _string_cache_msg("123 á 456")
+
+
 class TestDict:
     def test_encode_dict_raises_non_string_or_numeric_keys(self):
         with pytest.raises(
@@ -1906,13 +2215,13 @@ class TestDict:
 
     @pytest.mark.parametrize("x", [{}, {"a": 1}, {"a": 1, "b": 2}])
     def test_roundtrip_dict(self, x):
-        s = msgspec.json.encode(x)
-        x2 = msgspec.json.decode(s)
+        s = ENC.encode(x)
+        x2 = DEC_ANY.decode(s)
         assert x == x2
         assert json.loads(s) == x
 
     def test_decode_any_dict(self):
-        x = msgspec.json.decode(b'{"a": 1, "b": "two", "c": false}')
+        x = DEC_ANY.decode(b'{"a": 1, "b": "two", "c": false}')
         assert x == {"a": 1, "b": "two", "c": False}
 
     @pytest.mark.parametrize(
@@ -1925,7 +2234,7 @@ class TestDict:
         ],
     )
     def test_decode_dict_ignores_whitespace(self, s, x):
-        x2 = msgspec.json.decode(s)
+        x2 = DEC_ANY.decode(s)
         assert x == x2
 
     def test_decode_dict_wrong_element_type(self):
@@ -1965,11 +2274,10 @@ class TestDict:
         ):
             dec.decode(b'{"a": 1}')
 
-    @pytest.mark.parametrize("length", [3, 32, 33])
+    @pytest.mark.parametrize("length", [1, 3, 32, 33])
     def test_decode_dict_string_cache(self, length):
-        key = "x" * length
-        msg = [{key: 1}, {key: 2}, {key: 3}]
-        res = msgspec.json.decode(msgspec.json.encode(msg))
+        msg, buf = STRING_CACHE_MSGS[length]
+        res = DEC_ANY.decode(buf)
         assert msg == res
         ids = {id(k) for d in res for k in d.keys()}
         if length > 32:
@@ -1979,12 +2287,20 @@ class TestDict:
 
     def test_decode_dict_string_cache_ascii_only(self):
         """Short non-ascii strings aren't cached"""
-        s = "123 á 456"
-        msg = [{s: 1}, {s: 2}, {s: 3}]
-        res = msgspec.json.decode(msgspec.json.encode(msg))
+        _, buf = NON_ASCII_STRING_CACHE_MSG
+        res = DEC_ANY.decode(buf)
         ids = {id(k) for d in res for k in d.keys()}
         assert len(ids) == 3
 
+    def test_decode_dict_single_char_keys(self):
+        msg = {chr(i): i for i in range(128)}
+        buf = ENC.encode(msg)
+        res1 = DEC_ANY.decode(buf)
+        res2 = msgspec.json.decode(buf, type=Dict[str, int])
+        assert res1 == res2 == msg
+        for k1, k2 in zip(res1, res2):
+            assert k1 is k2
+
     @pytest.mark.parametrize(
         "key",
         [
@@ -2002,8 +2318,8 @@ class TestDict:
     )
     def test_roundtrip_dict_key_types(self, key):
         msg = {key: 100}
-        sol = msgspec.json.encode(msgspec.to_builtins(msg, str_keys=True))
-        res = msgspec.json.encode(msg)
+        sol = ENC.encode(msgspec.to_builtins(msg, str_keys=True))
+        res = ENC.encode(msg)
         assert res == sol
 
         msg2 = msgspec.json.decode(sol, type=Dict[type(key), int])
@@ -2022,29 +2338,29 @@ class TestDict:
     @pytest.mark.parametrize("x", [-(2**63), 2**64 - 1])
     def test_encode_dict_int_key(self, x):
         msg = {-(2**63): "a", 0: "b", 2**64 - 1: "c"}
-        s = msgspec.json.encode(msg)
+        s = ENC.encode(msg)
         assert s == b'{"-9223372036854775808":"a","0":"b","18446744073709551615":"c"}'
 
         for x in [-(2**63) - 1, 2**64]:
-            s = msgspec.json.encode({x: "a"})
-            assert s == f'{{"{x}":"a"}}'.encode("utf-8")
+            s = ENC.encode({x: "a"})
+            assert s == b'{"' + str(x).encode("ascii") + b'":"a"}'
 
     def test_decode_dict_int_key(self):
         msg = {-(2**63): "a", 0: "b", 2**64 - 1: "c"}
-        buf = msgspec.json.encode(msg)
+        buf = ENC.encode(msg)
         res = msgspec.json.decode(buf, type=Dict[int, str])
         assert res == msg
 
     @pytest.mark.parametrize("s", ['""', '"-"', '"a"', '"-a"', '"01"', '"1a"'])
     def test_decode_dict_int_key_malformed(self, s):
-        bad = ("{%s: 1}" % s).encode("utf-8")
+        bad = b"{" + s.encode("ascii") + b": 1}"
         with pytest.raises(msgspec.ValidationError, match="Expected `int`, got `str`"):
             msgspec.json.decode(bad, type=Dict[int, int])
 
     @pytest.mark.parametrize("x", [-(2**63) - 1, 2**64, 2**65])
     def test_decode_dict_big_int(self, x):
         msg = {str(x): 1}
-        buf = msgspec.json.encode(msg)
+        buf = ENC.encode(msg)
         res = msgspec.json.decode(buf, type=Dict[int, int])
         assert res == {x: 1}
         assert type(list(res)[0]) is int
@@ -2072,13 +2388,13 @@ class TestDict:
             float("inf"): 5,
             float("nan"): 6,
         }
-        sol = msgspec.json.encode({str(k): v for k, v in msg.items()})
-        res = msgspec.json.encode(msg)
+        sol = ENC.encode({str(k): v for k, v in msg.items()})
+        res = ENC.encode(msg)
         assert res == sol
 
     def test_decode_dict_float_key(self):
         msg = {"1.5": 1, "inf": 2, "-inf": 3, "0": 4, "-1.5e12": 5, "123": 6}
-        buf = msgspec.json.encode(msg)
+        buf = ENC.encode(msg)
         sol = {float(k): v for k, v in msg.items()}
         res = msgspec.json.decode(buf, type=Dict[float, int])
         assert res == sol
@@ -2094,7 +2410,7 @@ class TestDict:
         class mystr(str):
             pass
 
-        msg = msgspec.json.encode({mystr("test"): 1})
+        msg = ENC.encode({mystr("test"): 1})
         assert msg == b'{"test":1}'
 
     def test_encode_dict_custom_key(self):
@@ -2137,19 +2453,7 @@ class TestDict:
         obj = msgspec.json.decode(msg, type=Dict[Custom, int], dec_hook=dec_hook)
         assert obj == {Custom("a"): 1, Custom("b"): 2}
 
-    @pytest.mark.parametrize(
-        "s, error",
-        [
-            (b"{", "truncated"),
-            (b'{"a"', "truncated"),
-            (b"{,}", "object keys must be strings"),
-            (b"{:}", "object keys must be strings"),
-            (b"{1: 2}", "object keys must be strings"),
-            (b'{"a": 1, }', "trailing comma in object"),
-            (b'{"a": 1, "b" 2}', "expected ':'"),
-            (b'{"a": 1, "b": 2  "c"}', r"expected ',' or '}'"),
-        ],
-    )
+    @pytest.mark.parametrize("s, error", MALFORMED_OBJECTS)
     @pytest.mark.parametrize("type", [dict, Any])
     def test_decode_dict_malformed(self, s, error, type):
         with pytest.raises(msgspec.DecodeError, match=error):
@@ -2182,19 +2486,7 @@ class TestTypedDict:
         x2 = msgspec.json.decode(s, type=Test)
         assert x == x2
 
-    @pytest.mark.parametrize(
-        "s, error",
-        [
-            (b"{", "truncated"),
-            (b'{"a"', "truncated"),
-            (b"{,}", "object keys must be strings"),
-            (b"{:}", "object keys must be strings"),
-            (b"{1: 2}", "object keys must be strings"),
-            (b'{"a": 1, }', "trailing comma in object"),
-            (b'{"a": 1, "b" 2}', "expected ':'"),
-            (b'{"a": 1, "b": 2  "c"}', r"expected ',' or '}'"),
-        ],
-    )
+    @pytest.mark.parametrize("s, error", MALFORMED_OBJECTS)
     def test_decode_typeddict_malformed(self, s, error):
         class Test(TypedDict, total=False):
             a: int
@@ -2225,20 +2517,8 @@ class TestDataclass:
         x2 = msgspec.json.decode(s, type=Test)
         assert x2 == Test(**x)
 
-    @pytest.mark.parametrize(
-        "s, error",
-        [
-            (b"{", "truncated"),
-            (b'{"a"', "truncated"),
-            (b"{,}", "object keys must be strings"),
-            (b"{:}", "object keys must be strings"),
-            (b"{1: 2}", "object keys must be strings"),
-            (b'{"a": 1, }', "trailing comma in object"),
-            (b'{"a": 1, "b" 2}', "expected ':'"),
-            (b'{"a": 1, "b": 2  "c"}', r"expected ',' or '}'"),
-        ],
-    )
-    def test_decode_typeddict_malformed(self, s, error):
+    @pytest.mark.parametrize("s, error", MALFORMED_OBJECTS)
+    def test_decode_dataclass_malformed(self, s, error):
         @dataclass
         class Test:
             a: int
@@ -2248,6 +2528,59 @@ class TestDataclass:
             msgspec.json.decode(s, type=Test)
 
 
+def _int_tag_case(ndigits, negative):
+    tag = int("".join(itertools.islice(itertools.cycle("123456789"), ndigits)) or "0")
+    if negative:
+        tag = -tag
+
+    class Test(msgspec.Struct, tag=tag):
+        x: int
+
+    return Test, msgspec.json.Decoder(Test), msgspec.json.encode(Test(1))
+
+
+# Int-tagged struct types, decoders, and messages for every tag length
+INT_TAG_CASES = {
+    (ndigits, negative): _int_tag_case(ndigits, negative)
+    for ndigits in range(19)
+    for negative in [False, True]
+}
+
+
+STRUCT_TAG_MALFORMED = [
+    (b"{", "truncated"),
+    (b'{"type"', "truncated"),
+    (b"{,}", "object keys must be strings"),
+    (b"{:}", "object keys must be strings"),
+    (b"{1: 2}", "object keys must be strings"),
+    (b'{"type": "Test1", }', "trailing comma in object"),
+    (b'{"type": "Test1", "a" 1}', "expected ':'"),
+    (b'{"type": "Test1", "a": 1 "b"}', r"expected ',' or '}'"),
+    (b'{"type": nulp}', r"invalid character"),
+    (b'{"type": "nulp}', r"truncated"),
+    (b'{"a": 1, }', "trailing comma in object"),
+    (b'{"a": 1, "b" 1}', "expected ':'"),
+    (b'{"a": 1 "b"}', r"expected ',' or '}'"),
+]
+
+
+STRUCT_INT_TAG_MALFORMED = [
+    (b'{"type": 00}', "invalid number"),
+    (b'{"type": -n123}', "invalid character"),
+    (b'{"type": 123n}', "expected ',' or '}'"),
+    (b'{"type": 123.}', "invalid number"),
+    (b'{"type": 123.n}', "invalid number"),
+    (b'{"type": 123e}', "invalid number"),
+    (b'{"type": 123en}', "invalid number"),
+    (b'{"type": 123, }', "trailing comma in object"),
+    (b'{"type": 123, "a" 1}', "expected ':'"),
+    (b'{"type": 123, "a": 1 "b"}', "expected ',' or '}'"),
+    (b'{"type": nulp}', "invalid character"),
+    (b'{"type": "bad}', "truncated"),
+    (b'{"type": bad}', "invalid character"),
+]
+
+
 class TestStruct:
     @pytest.mark.parametrize("tag", [False, "Test", 123])
     def test_encode_empty_struct(self, tag):
@@ -2340,39 +2673,33 @@ class TestStruct:
 
         dec = msgspec.json.Decoder(Test)
 
-        pairs = list(zip("abcdef", range(6)))
+        fragments = [b'"%s":%d' % (k.encode(), v) for k, v in zip("abcdef", range(6))]
 
-        for data in itertools.permutations(pairs):
-            msg = msgspec.json.encode(dict(data))
+        for data in itertools.permutations(fragments):
+            msg = b"{" + b",".join(data) + b"}"
             res = dec.decode(msg)
             assert res == sol
 
     @pytest.mark.parametrize(
         "extra",
         [
-            None,
-            False,
-            True,
-            1,
-            2.0,
-            "three",
-            [1, 2],
-            {"a": 1},
+            b"null",
+            b"false",
+            b"true",
+            b"1",
+            b"2.0",
+            b'"three"',
+            b"[1,2]",
+            b'{"a":1}',
         ],
     )
     def test_decode_struct_ignore_extra_fields(self, extra):
         dec = msgspec.json.Decoder(Person)
 
-        a = msgspec.json.encode(
-            {
-                "extra1": extra,
-                "first": "harry",
-                "extra2": extra,
-                "last": "potter",
-                "age": 13,
-                "extra3": extra,
-            }
-        )
+        a = (
+            b'{"extra1":%s,"first":"harry","extra2":%s,'
+            b'"last":"potter","age":13,"extra3":%s}'
+        ) % (extra, extra, extra)
         res = dec.decode(a)
         assert res == Person("harry", "potter", 13)
 
@@ -2384,19 +2711,7 @@ class TestStruct:
         assert res == Person("harry", "potter", 13)
         assert res.prefect is False
 
-    @pytest.mark.parametrize(
-        "s, error",
-        [
-            (b"{", "truncated"),
-            (b'{"first"', "truncated"),
-            (b"{,}", "object keys must be strings"),
-            (b"{:}", "object keys must be strings"),
-            (b"{1: 2}", "object keys must be strings"),
-            (b'{"age": 13, }', "trailing comma in object"),
-            (b'{"age": 13, "first" "harry"}', "expected ':'"),
-            (b'{"age": 13, "first": "harry"  "c"}', r"expected ',' or '}'"),
-        ],
-    )
+    @pytest.mark.parametrize("s, error", MALFORMED_OBJECTS)
     def test_decode_struct_malformed(self, s, error):
         with pytest.raises(msgspec.DecodeError, match=error):
             msgspec.json.decode(s, type=Person)
@@ -2408,22 +2723,17 @@ class TestStruct:
             y: Any
             z: Tuple = ()
 
-        enc = msgspec.json.Encoder()
         dec = msgspec.json.Decoder(List[Test])
 
-        ts = [
-            Test(1, 2),
-            Test(3, "hello"),
-            Test([], []),
-            Test({}, {}),
-            Test(None, None, ()),
+        cases = [
+            (Test(1, 2), False),
+            (Test(3, "hello"), False),
+            (Test([], []), True),
+            (Test({}, {}), True),
+            (Test(None, None, ()), False),
         ]
-        a, b, c, d, e = dec.decode(enc.encode(ts))
-        assert not gc.is_tracked(a)
-        assert not gc.is_tracked(b)
-        assert gc.is_tracked(c)
-        assert gc.is_tracked(d)
-        assert not gc.is_tracked(e)
+        res = dec.decode(ENC.encode([t for t, _ in cases]))
+        assert [gc.is_tracked(r) for r in res] == [tracked for _, tracked in cases]
 
     @pytest.mark.parametrize("array_like", [False, True])
     def test_struct_gc_false_always_untracked_on_decode(self, array_like):
@@ -2442,11 +2752,10 @@ class TestStruct:
             assert not gc.is_tracked(obj)
 
     def test_struct_recursive_definition(self):
-        enc = msgspec.json.Encoder()
         dec = msgspec.json.Decoder(Node)
 
         x = Node(Node(Node(), Node(Node())))
-        s = enc.encode(x)
+        s = ENC.encode(x)
         res = dec.decode(s)
         assert res == x
 
@@ -2496,52 +2805,21 @@ class TestStruct:
         res = dec.decode(msgspec.json.encode({"type": tag}))
         assert res == Test()
 
-    @pytest.mark.parametrize(
-        "s, error",
-        [
-            (b"{", "truncated"),
-            (b'{"type"', "truncated"),
-            (b"{,}", "object keys must be strings"),
-            (b"{:}", "object keys must be strings"),
-            (b"{1: 2}", "object keys must be strings"),
-            (b'{"type": "Test1", }', "trailing comma in object"),
-            (b'{"type": "Test1", "a" 1}', "expected ':'"),
-            (b'{"type": "Test1", "a": 1 "b"}', r"expected ',' or '}'"),
-            (b'{"type": nulp}', r"invalid character"),
-            (b'{"type": "nulp}', r"truncated"),
-            (b'{"a": 1, }', "trailing comma in object"),
-            (b'{"a": 1, "b" 1}', "expected ':'"),
-            (b'{"a": 1 "b"}', r"expected ',' or '}'"),
-        ],
-    )
-    def test_decode_struct_tag_malformed(self, s, error):
+    def test_decode_struct_tag_malformed(self):
         class Test1(msgspec.Struct, tag=True):
             a: int
             b: int
 
-        with pytest.raises(msgspec.DecodeError, match=error):
-            msgspec.json.decode(s, type=Test1)
+        dec = msgspec.json.Decoder(Test1)
+        for s, error in STRUCT_TAG_MALFORMED:
+            with pytest.raises(msgspec.DecodeError, match=error):
+                dec.decode(s)
 
     @pytest.mark.parametrize("ndigits", range(19))
     @pytest.mark.parametrize("negative", [False, True])
     def test_decode_tagged_struct_int_tag(self, ndigits, negative):
-        if ndigits == 0:
-            s = b"0"
-        else:
-            s = "".join(
-                itertools.islice(itertools.cycle("123456789"), ndigits)
-            ).encode()
-
-        tag = int(s)
-        if negative:
-            tag = -tag
-
-        class Test(msgspec.Struct, tag=tag):
-            x: int
-
-        t = Test(1)
-        msg = msgspec.json.encode(t)
-        assert msgspec.json.decode(msg, type=Test) == t
+        cls, dec, msg = INT_TAG_CASES[ndigits, negative]
+        assert dec.decode(msg) == cls(1)
 
     def test_decode_tagged_struct_int_tag_uint64_always_invalid(self):
         """Uint64 values aren't currently valid tag values, but we still want
@@ -2555,55 +2833,55 @@ class TestStruct:
         assert f"Invalid value {2**64 - 1}" in str(rec.value)
         assert "`$.type`" in str(rec.value)
 
-    @pytest.mark.parametrize(
-        "s, error",
-        [
-            (b'{"type": 00}', "invalid number"),
-            (b'{"type": -n123}', "invalid character"),
-            (b'{"type": 123n}', "expected ',' or '}'"),
-            (b'{"type": 123.}', "invalid number"),
-            (b'{"type": 123.n}', "invalid number"),
-            (b'{"type": 123e}', "invalid number"),
-            (b'{"type": 123en}', "invalid number"),
-            (b'{"type": 123, }', "trailing comma in object"),
-            (b'{"type": 123, "a" 1}', "expected ':'"),
-            (b'{"type": 123, "a": 1 "b"}', "expected ',' or '}'"),
-            (b'{"type": nulp}', "invalid character"),
-            (b'{"type": "bad}', "truncated"),
-            (b'{"type": bad}', "invalid character"),
-        ],
-    )
-    def test_decode_struct_int_tag_malformed(self, s, error):
+    def test_decode_struct_int_tag_malformed(self):
         class Test1(msgspec.Struct, tag=123):
             a: int
             b: int
 
-        with pytest.raises(msgspec.DecodeError, match=error):
-            msgspec.json.decode(s, type=Test1)
+        dec = msgspec.json.Decoder(Test1)
+        for s, error in STRUCT_INT_TAG_MALFORMED:
+            with pytest.raises(msgspec.DecodeError, match=error):
+                dec.decode(s)
+
+
+STRUCT_UNION_MALFORMED = [
+    (b"{", "truncated"),
+    (b'{"type"', "truncated"),
+    (b"{,}", "object keys must be strings"),
+    (b"{:}", "object keys must be strings"),
+    (b"{1: 2}", "object keys must be strings"),
+    (b'{"type": "Test1", }', "trailing comma in object"),
+    (b'{"type": "Test1", "a" 1}', "expected ':'"),
+    (b'{"type": "Test1", "a": 1 "b"}', r"expected ',' or '}'"),
+    (b'{"type": nulp}', r"invalid character"),
+    (b'{"a": 1, }', "trailing comma in object"),
+    (b'{"a": 1, "b" 1}', "expected ':'"),
+    (b'{"a": 1 "b"}', r"expected ',' or '}'"),
+]
+
+
+STRUCT_UNION_INT_TAG_MALFORMED = [
+    (b'{"type": 00}', "invalid number"),
+    (b'{"type": -n123}', "invalid character"),
+    (b'{"type": 123n}', "expected ',' or '}'"),
+    (b'{"type": 123.}', "invalid number"),
+    (b'{"type": 123.n}', "invalid number"),
+    (b'{"type": 123e}', "invalid number"),
+    (b'{"type": 123en}', "invalid number"),
+    (b'{"type": 123, }', "trailing comma in object"),
+    (b'{"type": 123, "a" 1}', "expected ':'"),
+    (b'{"type": 123, "a": 1 "b"}', "expected ',' or '}'"),
+    (b'{"type": nulp}', "invalid character"),
+    (b'{"type": "bad}', "truncated"),
+    (b'{"type": bad}', "invalid character"),
+]
 
 
 class TestStructUnion:
     """Most functionality is tested in `test_common.py:TestStructUnion`, this only
     checks for malformed inputs and whitespace handling"""
 
-    @pytest.mark.parametrize(
-        "s, error",
-        [
-            (b"{", "truncated"),
-            (b'{"type"', "truncated"),
-            (b"{,}", "object keys must be strings"),
-            (b"{:}", "object keys must be strings"),
-            (b"{1: 2}", "object keys must be strings"),
-            (b'{"type": "Test1", }', "trailing comma in object"),
-            (b'{"type": "Test1", "a" 1}', "expected ':'"),
-            (b'{"type": "Test1", "a": 1 "b"}', r"expected ',' or '}'"),
-            (b'{"type": nulp}', r"invalid character"),
-            (b'{"a": 1, }', "trailing comma in object"),
-            (b'{"a": 1, "b" 1}', "expected ':'"),
-            (b'{"a": 1 "b"}', r"expected ',' or '}'"),
-        ],
-    )
-    def test_decode_struct_union_malformed(self, s, error):
+    def test_decode_struct_union_malformed(self):
         class Test1(msgspec.Struct, tag=True):
             a: int
             b: int
@@ -2611,28 +2889,12 @@ class TestStructUnion:
         class Test2(msgspec.Struct, tag=True):
             pass
 
-        with pytest.raises(msgspec.DecodeError, match=error):
-            msgspec.json.decode(s, type=Union[Test1, Test2])
+        dec = msgspec.json.Decoder(Union[Test1, Test2])
+        for s, error in STRUCT_UNION_MALFORMED:
+            with pytest.raises(msgspec.DecodeError, match=error):
+                dec.decode(s)
 
-    @pytest.mark.parametrize(
-        "s, error",
-        [
-            (b'{"type": 00}', "invalid number"),
-            (b'{"type": -n123}', "invalid character"),
-            (b'{"type": 123n}', "expected ',' or '}'"),
-            (b'{"type": 123.}', "invalid number"),
-            (b'{"type": 123.n}', "invalid number"),
-            (b'{"type": 123e}', "invalid number"),
-            (b'{"type": 123en}', "invalid number"),
-            (b'{"type": 123, }', "trailing comma in object"),
-            (b'{"type": 123, "a" 1}', "expected ':'"),
-            (b'{"type": 123, "a": 1 "b"}', "expected ',' or '}'"),
-            (b'{"type": nulp}', "invalid character"),
-            (b'{"type": "bad}', "truncated"),
-            (b'{"type": bad}', "invalid character"),
-        ],
-    )
-    def test_decode_struct_union_int_tag_malformed(self, s, error):
+    def test_decode_struct_union_int_tag_malformed(self):
         class Test1(msgspec.Struct, tag=-123):
             a: int
             b: int
@@ -2640,8 +2902,10 @@ class TestStructUnion:
         class Test2(msgspec.Struct, tag=123):
             pass
 
-        with pytest.raises(msgspec.DecodeError, match=error):
-            msgspec.json.decode(s, type=Union[Test1, Test2])
+        dec = msgspec.json.Decoder(Union[Test1, Test2])
+        for s, error in STRUCT_UNION_INT_TAG_MALFORMED:
+            with pytest.raises(msgspec.DecodeError, match=error):
+                dec.decode(s)
 
     @pytest.mark.parametrize(
         "s",
@@ -2681,6 +2945,35 @@ class TestStructUnion:
         res = msgspec.json.decode(s, type=Union[Test1, Test2])
         assert res == Test1(1, 2)
 
+    @pytest.mark.parametrize("ndigits", range(1, 20))
+    @pytest.mark.parametrize("negative", [False, True])
+    def test_decode_struct_union_int_tag_digit_counts(self, ndigits, negative):
+        tag = int(("123456789" * 3)[:ndigits]) * (-1 if negative else 1)
+
+        class Test1(msgspec.Struct, tag=tag):
+            a: int
+
+        class Test2(msgspec.Struct, tag=tag + 1):
+            pass
+
+        dec = msgspec.json.Decoder(Union[Test1, Test2])
+        for suffix in [b"", b"   ", b"          "]:
+            msg = b'{"type":' + str(tag).encode() + suffix + b',"a":1}'
+            assert dec.decode(msg) == Test1(1)
+        msg = b'{"type":' + str(tag + 2).encode() + b',"a":1}'
+        with pytest.raises(msgspec.ValidationError, match="Invalid value"):
+            dec.decode(msg)
+
+
+STRUCT_ARRAY_LIKE_MALFORMED = [
+    (b"[", "truncated"),
+    (b"[1", "truncated"),
+    (b"[,]", "invalid character"),
+    (b"[, 1]", "invalid character"),
+    (b"[1, ]", "trailing comma in array"),
+    (b"[1, 2 3]", r"expected ',' or ']'"),
+]
+
 
 class TestStructArray:
     @pytest.mark.parametrize("tag", [False, True])
@@ -2791,25 +3084,16 @@ class TestStructArray:
         ):
             array_dec.decode(map_msg)
 
-    @pytest.mark.parametrize(
-        "s, error",
-        [
-            (b"[", "truncated"),
-            (b"[1", "truncated"),
-            (b"[,]", "invalid character"),
-            (b"[, 1]", "invalid character"),
-            (b"[1, ]", "trailing comma in array"),
-            (b"[1, 2 3]", r"expected ',' or ']'"),
-        ],
-    )
-    def test_decode_struct_array_like_malformed(self, s, error):
+    def test_decode_struct_array_like_malformed(self):
         class Point(msgspec.Struct, array_like=True):
             x: int
             y: int
             z: int
 
-        with pytest.raises(msgspec.DecodeError, match=error):
-            msgspec.json.decode(s, type=Point)
+        dec = msgspec.json.Decoder(Point)
+        for s, error in STRUCT_ARRAY_LIKE_MALFORMED:
+            with pytest.raises(msgspec.DecodeError, match=error):
+                dec.decode(s)
 
     @pytest.mark.parametrize("tag", ["Test", 123])
     def test_decode_tagged_struct(self, tag):
@@ -2876,29 +3160,44 @@ class TestStructArray:
         assert "Expected `array` of at least length 1, got 0" in str(rec.value)
 
 
+STRUCT_ARRAY_LIKE_UNION_MALFORMED = [
+    (b"[,]", "invalid character"),
+    (b"[, 1]", "invalid character"),
+    (b"[nulp]", "invalid character"),
+    (b'["Test1", nulp]', "invalid character"),
+    (b"[", "truncated"),
+    (b'["Test1', "truncated"),
+    (b'["Test1"', "truncated"),
+    (b'["Test1",', "truncated"),
+    (b'["Test1]', "truncated"),
+    (b'["Test1", ]', "trailing comma in array"),
+    (b'["Test1" g', r"expected ',' or ']'"),
+    (b'["Test1", 1 g', r"expected ',' or ']'"),
+    (b'["Test1", 2 3]', r"expected ',' or ']'"),
+]
+
+
+STRUCT_ARRAY_LIKE_UNION_INT_TAG_MALFORMED = [
+    (b"[,]", "invalid character"),
+    (b"[, 1]", "invalid character"),
+    (b"[nulp]", "invalid character"),
+    (b"[123, nulp]", "invalid character"),
+    (b"[", "truncated"),
+    (b"[123.n,", "invalid number"),
+    (b"[123en,", "invalid number"),
+    (b"[123", "truncated"),
+    (b"[123,", "truncated"),
+    (b"[123, ]", "trailing comma in array"),
+    (b"[123 g", r"expected ',' or ']'"),
+    (b"[123, 1 g", r"expected ',' or ']'"),
+]
+
+
 class TestStructArrayUnion:
     """Most functionality is tested in `test_common.py:TestStructUnion`, this
     only checks for malformed inputs and whitespace handling"""
 
-    @pytest.mark.parametrize(
-        "s, error",
-        [
-            (b"[,]", "invalid character"),
-            (b"[, 1]", "invalid character"),
-            (b"[nulp]", "invalid character"),
-            (b'["Test1", nulp]', "invalid character"),
-            (b"[", "truncated"),
-            (b'["Test1', "truncated"),
-            (b'["Test1"', "truncated"),
-            (b'["Test1",', "truncated"),
-            (b'["Test1]', "truncated"),
-            (b'["Test1", ]', "trailing comma in array"),
-            (b'["Test1" g', r"expected ',' or ']'"),
-            (b'["Test1", 1 g', r"expected ',' or ']'"),
-            (b'["Test1", 2 3]', r"expected ',' or ']'"),
-        ],
-    )
-    def test_decode_struct_array_like_union_malformed(self, s, error):
+    def test_decode_struct_array_like_union_malformed(self):
         class Test1(msgspec.Struct, tag=True, array_like=True):
             x: int
             y: int
@@ -2907,27 +3206,12 @@ class TestStructArrayUnion:
         class Test2(msgspec.Struct, tag=True, array_like=True):
             pass
 
-        with pytest.raises(msgspec.DecodeError, match=error):
-            msgspec.json.decode(s, type=Union[Test1, Test2])
+        dec = msgspec.json.Decoder(Union[Test1, Test2])
+        for s, error in STRUCT_ARRAY_LIKE_UNION_MALFORMED:
+            with pytest.raises(msgspec.DecodeError, match=error):
+                dec.decode(s)
 
-    @pytest.mark.parametrize(
-        "s, error",
-        [
-            (b"[,]", "invalid character"),
-            (b"[, 1]", "invalid character"),
-            (b"[nulp]", "invalid character"),
-            (b"[123, nulp]", "invalid character"),
-            (b"[", "truncated"),
-            (b"[123.n,", "invalid number"),
-            (b"[123en,", "invalid number"),
-            (b"[123", "truncated"),
-            (b"[123,", "truncated"),
-            (b"[123, ]", "trailing comma in array"),
-            (b"[123 g", r"expected ',' or ']'"),
-            (b"[123, 1 g", r"expected ',' or ']'"),
-        ],
-    )
-    def test_decode_struct_array_like_union_int_tag_malformed(self, s, error):
+    def test_decode_struct_array_like_union_int_tag_malformed(self):
         class Test1(msgspec.Struct, tag=123, array_like=True):
             x: int
             y: int
@@ -2936,8 +3220,10 @@ class TestStructArrayUnion:
         class Test2(msgspec.Struct, tag=-123, array_like=True):
             pass
 
-        with pytest.raises(msgspec.DecodeError, match=error):
-            msgspec.json.decode(s, type=Union[Test1, Test2])
+        dec = msgspec.json.Decoder(Union[Test1, Test2])
+        for s, error in STRUCT_ARRAY_LIKE_UNION_INT_TAG_MALFORMED:
+            with pytest.raises(msgspec.DecodeError, match=error):
+                dec.decode(s)
 
     def test_decode_struct_array_union_ignores_whitespace(self):
         s = b'  [  "Test1"  ,  1  ,  2  ]  '
@@ -224,6 +224,16 @@ class TestDecodeFunction:
         for _ in range(2):
             assert msgspec.msgpack.decode(msg, type=Point) == Point(1, 2)
 
+    def test_decode_type_many_types(self):
+        # More types than fit in the internal TypeNode cache
+        types = [Tuple[(int,) * n] for n in range(1, 150)]
+        for _ in range(2):
+            for n, typ in enumerate(types, 1):
+                msg = msgspec.msgpack.encode(list(range(n)))
+                assert msgspec.msgpack.decode(msg, type=typ) == tuple(range(n))
+                with pytest.raises(msgspec.ValidationError):
+                    msgspec.msgpack.decode(b"\x90", type=typ)
+
     def test_decode_type_struct_not_json_compatible(self):
         class Test(msgspec.Struct):
             x: Dict[int, str]
@@ -545,7 +555,7 @@ class TestDecoderMisc:
         with pytest.raises(msgspec.DecodeError, match="truncated"):
             msgspec.msgpack.decode(msg, type=Test)
 
-    @pytest.mark.parametrize("length", [3, 31, 33])
+    @pytest.mark.parametrize("length", [1, 3, 31, 33])
     @pytest.mark.parametrize("typed", [False, True])
     def test_decode_dict_string_cache(self, length, typed):
         key = "x" * length
@@ -570,6 +580,15 @@ class TestDecoderMisc:
         ids = {id(k) for d in res for k in d.keys()}
         assert len(ids) == 3
 
+    def test_decode_dict_single_char_keys(self):
+        msg = {chr(i): i for i in range(256)}
+        buf = msgspec.msgpack.encode(msg)
+        res1 = msgspec.msgpack.decode(buf)
+        res2 = msgspec.msgpack.decode(buf, type=Dict[str, int])
+        assert res1 == res2 == msg
+        for k1, k2 in zip(list(res1)[:128], list(res2)[:128]):
+            assert k1 is k2
+
     @pytest.mark.parametrize("type", [None, list, tuple, set])
     def test_decoding_large_arrays_doesnt_preallocate(self, type):
         # <maximum sized array, truncated>
@@ -869,6 +888,18 @@ class TestTypedDecoder:
         ):
             dec.decode(enc.encode((1, 2)))
 
+    def test_fixtuple_gc_maybe_untracked(self):
+        enc = msgspec.msgpack.Encoder()
+        dec = msgspec.msgpack.Decoder(List[Tuple[Any, Any]])
+        msg = enc.encode([(1, "two"), (None, 1.5), ([], 1), (1, {})])
+        a, b, c, d = dec.decode(msg)
+        assert not gc.is_tracked(a)
+        assert not gc.is_tracked(b)
+        assert gc.is_tracked(c)
+        assert gc.is_tracked(d)
+        dec = msgspec.msgpack.Decoder(Tuple[Tuple[int, str], float])
+        assert not gc.is_tracked(dec.decode(enc.encode(((1, "two"), 3.0))))
+
     @pytest.mark.parametrize("size", SIZES)
     def test_dict_lengths(self, size):
         enc = msgspec.msgpack.Encoder()